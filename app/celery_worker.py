@@ -18,4 +18,12 @@ celery_app = Celery(
 )
 
 
-celery_app.conf.task_routes = {"app.tasks.*": {"queue": "emails"}}
\ No newline at end of file
+celery_app.conf.imports = ("tasks.segmentation_tasks",)
+
+# Most specific pattern first: segmentation is CPU bound and gets its own queue
+celery_app.conf.task_routes = {
+    "app.tasks.segmentation_tasks.*": {"queue": "segmentation"},
+    "app.tasks.*": {"queue": "emails"},
+}
+celery_app.conf.task_track_started = True
+celery_app.conf.result_extended = True
\ No newline at end of file
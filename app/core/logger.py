@@ -28,3 +28,18 @@ console_handler.setFormatter(formatter)
 
 logger.addHandler(file_handler)
 logger.addHandler(console_handler)
+
+# Statements over SQL_SLOW_QUERY_MS (database/query_stats.py), kept apart
+# from the application log
+slow_query_logger = logging.getLogger("animatic-vision.slow-sql")
+slow_query_logger.setLevel(logging.INFO)
+slow_query_logger.propagate = False
+
+slow_query_handler = RotatingFileHandler(
+    filename=os.path.join(LOG_DIR, "logs", "slow_queries.log"),
+    maxBytes=5 * 1024 * 1024,
+    backupCount=5,
+    encoding="utf-8",
+)
+slow_query_handler.setFormatter(formatter)
+slow_query_logger.addHandler(slow_query_handler)
@@ -0,0 +1,32 @@
+# core/pagination.py
+import json
+import base64
+from datetime import datetime
+from typing import Tuple
+from sqlalchemy import and_, or_
+from sqlalchemy.sql.elements import ColumnElement
+
+
+def encode_cursor(created_at: datetime, id: int) -> str:
+    """Opaque cursor pointing just after the (created_at, id) of a row"""
+    payload = json.dumps([created_at.isoformat(), id]).encode("utf-8")
+    return base64.urlsafe_b64encode(payload).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, id = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(created_at), int(id)
+    except (ValueError, TypeError) as e:
+        raise ValueError("Invalid cursor") from e
+
+
+def keyset_before(created_col, id_col, cursor: Tuple[datetime, int]) -> ColumnElement:
+    """Rows after ``cursor`` when ordering by (created_at DESC, id DESC).
+
+    Written out instead of a row-value comparison so MySQL can range-scan
+    an index on (…, created_at, id).
+    """
+    created_at, id = cursor
+    return or_(created_col < created_at, and_(created_col == created_at, id_col < id))
@@ -1,3 +1,4 @@
+import json
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 from typing import Optional, Any
@@ -8,6 +9,10 @@ class ApiResponse(BaseModel):
     status_code: int = 200
     data: Optional[Any] = None
 
+    @classmethod
+    def error(cls, message: str, status_code: int = 400):
+        return cls(message=message, status_code=status_code)
+
 
 def success_response(message: str, data=None, status_code: int = 200):
     return JSONResponse(
@@ -20,3 +25,8 @@ def error_response(message: str, status_code: int = 400):
     return JSONResponse(
         content={"success": False, "message": message}, status_code=status_code
     )
+
+
+def sse_event(event: str, data=None) -> str:
+    """Format one Server-Sent Events message"""
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
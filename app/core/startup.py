@@ -0,0 +1,69 @@
+import time
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, List
+from core.logger import logger
+
+
+class StartupState:
+    """Timings of the startup phases and whether warm-up has finished.
+
+    A failed phase is recorded and logged but does not stop the process:
+    the app still starts, /health/live answers and /health/ready reports
+    what is missing.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.started_at = time.monotonic()
+        self.phases: Dict[str, dict] = {}
+        self.warmed_up = False
+        self.ready_seconds: float | None = None
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[dict]:
+        """Time a phase; anything put in the yielded dict is reported with it"""
+        details: dict = {}
+        start = time.perf_counter()
+        try:
+            yield details
+        except Exception as e:
+            self._record(name, start, details, error=str(e))
+            logger.error(f"❌ Startup phase '{name}' failed: {e}")
+        else:
+            self._record(name, start, details)
+
+    def _record(self, name: str, start: float, details: dict, error: str | None = None) -> None:
+        entry = {"ms": round((time.perf_counter() - start) * 1000, 1), "ok": error is None}
+        entry.update(details)
+        if error is not None:
+            entry["error"] = error
+        with self._lock:
+            self.phases[name] = entry
+
+    def failed(self, name: str) -> bool:
+        with self._lock:
+            return name in self.phases and not self.phases[name]["ok"]
+
+    def failed_phases(self, names: Iterable[str]) -> List[str]:
+        with self._lock:
+            return [n for n in names if n in self.phases and not self.phases[n]["ok"]]
+
+    def finish_warm_up(self) -> None:
+        with self._lock:
+            self.warmed_up = True
+            self.ready_seconds = round(time.monotonic() - self.started_at, 3)
+            timings = ", ".join(f"{n}={p['ms']}ms" for n, p in self.phases.items())
+        logger.info(f"🚀 Warm-up finished {self.ready_seconds}s after boot ({timings})")
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "uptime_seconds": round(time.monotonic() - self.started_at, 3),
+                "warmed_up": self.warmed_up,
+                "ready_after_seconds": self.ready_seconds,
+                "phases": {name: dict(p) for name, p in self.phases.items()},
+            }
+
+
+startup_state = StartupState()
@@ -1,8 +1,10 @@
-from app.database.session import base, engine
+from database.session import base, engine
 from app.database.models.user import User
 from app.database.models.project import Project
 from app.database.models.scene import Scene
 from app.database.models.asset import Asset
 
 def init_models():
-    pass
+    """Create missing tables. Development only: production schemas are
+    managed by Alembic (alembic upgrade head)"""
+    base.metadata.create_all(bind=engine)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, Enum, DateTime, JSON, func
+from sqlalchemy import Column, Integer, String, ForeignKey, Enum, DateTime, JSON, Index, func
 from sqlalchemy.orm import relationship
 from database.session import base
 import enum
@@ -14,6 +14,7 @@ class AssetType(str, enum.Enum):
 
 class Asset(base):
     __tablename__ = "assets"
+    __table_args__ = (Index("ix_assets_project_id_type", "project_id", "type"),)
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     project_id = Column(
         Integer, ForeignKey("projects.id", ondelete="CASCADE"), nullable=False
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, ForeignKey, Enum, DateTime, func
+from sqlalchemy import Column, Integer, String, Text, ForeignKey, Enum, DateTime, Index, func
 from sqlalchemy.orm import relationship
 from database.session import base
 import enum
@@ -13,6 +13,10 @@ class ProjectStatus(str, enum.Enum):
 
 class Project(base):
     __tablename__ = "projects"
+    __table_args__ = (
+        # A user's projects, newest first (and the list's keyset cursor)
+        Index("ix_projects_user_id_created_at_id", "user_id", "created_at", "id"),
+    )
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     user_id = Column(
         Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False
@@ -28,8 +32,15 @@ class Project(base):
     # Relationships
     owner = relationship("User", back_populates="projects")
     scenes = relationship(
-        "Scene", back_populates="project", cascade="all, delete-orphan"
+        "Scene",
+        back_populates="project",
+        cascade="all, delete-orphan",
+        order_by="Scene.scene_index",
+        passive_deletes=True,
     )
     assets = relationship(
-        "Asset", back_populates="project", cascade="all, delete-orphan"
+        "Asset",
+        back_populates="project",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
     )
@@ -1,10 +1,16 @@
-from sqlalchemy import Column, Integer, Text, ForeignKey, String, JSON
+from sqlalchemy import Column, Integer, Text, ForeignKey, String, JSON, Float, UniqueConstraint
 from sqlalchemy.orm import relationship
 from database.session import base
 
 
 class Scene(base):
     __tablename__ = "scenes"
+    __table_args__ = (
+        # One scene per position; also serves "scenes of a project in order"
+        UniqueConstraint(
+            "project_id", "scene_index", name="uq_scenes_project_id_scene_index"
+        ),
+    )
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     project_id = Column(
         Integer, ForeignKey("projects.id", ondelete="CASCADE"), nullable=False
@@ -15,5 +21,8 @@ class Scene(base):
     background_path = Column(String(500))
     character_prompts = Column(JSON, nullable=True)
     character_paths = Column(JSON, nullable=True)
+    fingerprint = Column(String(64), nullable=True)
+    start_sec = Column(Float, nullable=True)
+    duration_sec = Column(Float, nullable=True)
 
     project = relationship("Project", back_populates="scenes")
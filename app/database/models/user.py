@@ -1,5 +1,5 @@
 import enum
-from sqlalchemy import Column, Integer, String, DateTime, func, Enum
+from sqlalchemy import Boolean, Column, Integer, String, DateTime, func, Enum, Index, false
 from sqlalchemy.orm import relationship
 from database.session import base
 
@@ -10,11 +10,23 @@ class UserRole(enum.Enum):
 
 class User(base):
     __tablename__ = "users"
+    __table_args__ = (
+        # Admin search: FULLTEXT on MySQL, prefix LIKE on the B-trees elsewhere
+        Index("ix_users_fulltext", "fullName", "email", mysql_prefix="FULLTEXT"),
+        Index("ix_users_fullName", "fullName"),
+        # Keyset pagination of the admin list, with and without a role filter
+        Index("ix_users_created_at_id", "created_at", "id"),
+        Index("ix_users_role_created_at_id", "role", "created_at", "id"),
+    )
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     fullName = Column(String(100), nullable=False)
     email = Column(String(100), unique=True, nullable=False)
     password = Column(String(100), nullable=False)
     role = Column(Enum(UserRole), default=UserRole.user, nullable=False)
+    # Set by admins (e.g. in bulk); cleared when the user sets a new password
+    password_reset_required = Column(
+        Boolean, default=False, server_default=false(), nullable=False
+    )
     created_at = Column(
         DateTime(timezone=True), server_default=func.now(), nullable=False
     )
@@ -29,4 +41,11 @@ class User(base):
         return f"<User(id={self.id}, email='{self.email}', role='{self.role}')>"
 
     # Relationship 
-    projects = relationship("Project", back_populates="owner", cascade="all, delete-orphan")
\ No newline at end of file
+    # ON DELETE CASCADE removes projects, scenes and assets in the database;
+    # passive_deletes stops the ORM from loading them first
+    projects = relationship(
+        "Project",
+        back_populates="owner",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+    )
\ No newline at end of file
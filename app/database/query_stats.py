@@ -0,0 +1,159 @@
+# database/query_stats.py
+import os
+import re
+import time
+import threading
+from contextvars import ContextVar
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from core.logger import logger, slow_query_logger
+
+# Statements slower than this go to logs/slow_queries.log
+SQL_SLOW_QUERY_MS = float(os.getenv("SQL_SLOW_QUERY_MS", "200"))
+# The same statement shape this many times in one request is an N+1 suspect
+SQL_N_PLUS_ONE_THRESHOLD = int(os.getenv("SQL_N_PLUS_ONE_THRESHOLD", "5"))
+# X-DB-* and Server-Timing response headers; on by default in development
+SQL_DEBUG_HEADERS = (
+    os.getenv(
+        "SQL_DEBUG_HEADERS",
+        "true" if os.getenv("ENVIROMENT") == "development" else "false",
+    ).lower()
+    == "true"
+)
+SLOWEST_KEPT = 3
+
+# Expanded IN lists differ only in their number of placeholders
+_PLACEHOLDER = r"(?:\?|%s|%\(\w+\)s|:\w+)"
+_PLACEHOLDER_LIST = re.compile(rf"\(\s*{_PLACEHOLDER}(?:\s*,\s*{_PLACEHOLDER})*\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def statement_shape(statement: str) -> str:
+    """Statement text with IN lists collapsed, so repeats compare equal"""
+    return _PLACEHOLDER_LIST.sub("(?)", _WHITESPACE.sub(" ", statement).strip())
+
+
+class QueryStats:
+    """Statements run on behalf of one request (or any other unit of work).
+
+    Statements arrive from the event loop and from threadpool workers, which
+    share this object through the context variable, hence the lock.
+    """
+
+    def __init__(self, label: str = ""):
+        self.label = label
+        self._lock = threading.Lock()
+        self.count = 0
+        self.total_seconds = 0.0
+        self.shapes: dict[str, int] = {}
+        self.slowest: list[tuple[float, str]] = []
+
+    def record(self, statement: str, seconds: float) -> None:
+        shape = statement_shape(statement)
+        with self._lock:
+            self.count += 1
+            self.total_seconds += seconds
+            self.shapes[shape] = self.shapes.get(shape, 0) + 1
+            if len(self.slowest) < SLOWEST_KEPT or seconds > self.slowest[-1][0]:
+                self.slowest.append((seconds, shape))
+                self.slowest.sort(reverse=True)
+                del self.slowest[SLOWEST_KEPT:]
+
+    def repeated(self) -> dict[str, int]:
+        """Shapes run at least SQL_N_PLUS_ONE_THRESHOLD times"""
+        with self._lock:
+            return {
+                shape: n
+                for shape, n in self.shapes.items()
+                if n >= SQL_N_PLUS_ONE_THRESHOLD
+            }
+
+    def summary(self) -> dict:
+        with self._lock:
+            return {
+                "queries": self.count,
+                "db_ms": round(self.total_seconds * 1000, 2),
+                "slowest": [
+                    {"ms": round(seconds * 1000, 2), "statement": shape}
+                    for seconds, shape in self.slowest
+                ],
+            }
+
+
+current_query_stats: ContextVar[QueryStats | None] = ContextVar(
+    "current_query_stats", default=None
+)
+
+
+def instrument_queries(engine: Engine) -> None:
+    """Time every statement; pass ``sync_engine`` for async engines"""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        seconds = time.perf_counter() - conn.info["query_start"].pop()
+        stats = current_query_stats.get()
+        if stats is not None:
+            stats.record(statement, seconds)
+        if seconds * 1000 >= SQL_SLOW_QUERY_MS:
+            slow_query_logger.warning(
+                f"{seconds * 1000:.1f}ms [{stats.label if stats else '-'}] "
+                f"{statement_shape(statement)}"
+            )
+
+    @event.listens_for(engine, "handle_error")
+    def handle_error(context):
+        # The after hook never runs for a failed statement
+        if context.connection is not None:
+            starts = context.connection.info.get("query_start")
+            if starts:
+                starts.pop()
+
+
+def report(stats: QueryStats) -> None:
+    """Log the N+1 suspects of a finished unit of work"""
+    for shape, n in stats.repeated().items():
+        logger.warning(f"⚠️ Possible N+1 in {stats.label}: {n}x {shape}")
+
+
+class QueryStatsMiddleware:
+    """Collects QueryStats per HTTP request.
+
+    Plain ASGI rather than BaseHTTPMiddleware so streaming responses pass
+    straight through. Headers go out with the response start, so for a
+    stream they only cover what ran before its first chunk.
+    """
+
+    def __init__(self, app, debug_headers: bool = SQL_DEBUG_HEADERS):
+        self.app = app
+        self.debug_headers = debug_headers
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = QueryStats(f"{scope['method']} {scope['path']}")
+        token = current_query_stats.set(stats)
+
+        async def send_with_headers(message):
+            if message["type"] == "http.response.start" and self.debug_headers:
+                summary = stats.summary()
+                slowest = summary["slowest"][0]["ms"] if summary["slowest"] else 0
+                message["headers"] = list(message.get("headers", [])) + [
+                    (b"x-db-query-count", str(summary["queries"]).encode()),
+                    (b"x-db-time-ms", str(summary["db_ms"]).encode()),
+                    (b"x-db-slowest-ms", str(slowest).encode()),
+                    (b"x-db-n-plus-one", str(len(stats.repeated())).encode()),
+                    (b"server-timing", f"db;dur={summary['db_ms']}".encode()),
+                ]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_headers)
+        finally:
+            current_query_stats.reset(token)
+            report(stats)
@@ -0,0 +1,165 @@
+# database/routing.py
+import time
+import inspect
+import functools
+import threading
+from typing import Callable, List, Optional
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.dml import UpdateBase
+from core.exceptions import DatabaseConnectionError
+from core.logger import logger
+
+
+class ReplicaSet:
+    """Read replicas picked round-robin.
+
+    A replica that fails is skipped for ``retry_after`` seconds, so reads go
+    to the remaining replicas or, with none left, to the primary.
+    """
+
+    def __init__(self, engines: List[Engine], retry_after: float = 30.0):
+        self.engines = engines
+        self.retry_after = retry_after
+        self._down_until = {id(e): 0.0 for e in engines}
+        self._lock = threading.Lock()
+        self._next = 0
+        self.reads = 0
+        self.failures = 0
+
+    def pick(self) -> Optional[Engine]:
+        now = time.monotonic()
+        with self._lock:
+            for _ in range(len(self.engines)):
+                engine = self.engines[self._next % len(self.engines)]
+                self._next += 1
+                if self._down_until[id(engine)] <= now:
+                    self.reads += 1
+                    return engine
+        return None
+
+    def mark_down(self, engine: Engine) -> None:
+        with self._lock:
+            self.failures += 1
+            self._down_until[id(engine)] = time.monotonic() + self.retry_after
+
+    def stats(self) -> dict:
+        now = time.monotonic()
+        with self._lock:
+            return {
+                "replicas": [
+                    {
+                        "url": e.url.render_as_string(hide_password=True),
+                        "healthy": self._down_until[id(e)] <= now,
+                    }
+                    for e in self.engines
+                ],
+                "reads": self.reads,
+                "failures": self.failures,
+            }
+
+
+class RoutingSession(Session):
+    """Session that sends reads made inside ``@read_only`` methods to a replica.
+
+    Flushes and INSERT/UPDATE/DELETE statements always use the primary, and
+    once the session has written, every later read does too (read your own
+    writes for the rest of the request). Also used as ``sync_session_class``
+    of the async sessions, with the replicas' ``sync_engine``.
+    """
+
+    def __init__(self, *args, replicas: Optional[ReplicaSet] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.replicas = replicas
+        self.read_only = False
+        self.wrote = False
+        self.replica: Optional[Engine] = None
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        if self._flushing or isinstance(clause, UpdateBase):
+            self.wrote = True
+        elif self.read_only and not self.wrote and self.replicas is not None:
+            replica = self.replicas.pick()
+            if replica is not None:
+                self.replica = replica
+                return replica
+        return super().get_bind(mapper, clause=clause, **kwargs)
+
+
+def _routing_session(db) -> Optional[RoutingSession]:
+    session = getattr(db, "sync_session", db)  # AsyncSession wraps one
+    if isinstance(session, RoutingSession) and session.replicas is not None:
+        return session
+    return None
+
+
+def read_only(method: Callable = None, *, fallback_on_miss: bool = False):
+    """Let a repository method read from a replica.
+
+    If the replica fails, it is marked down and the call is repeated on the
+    primary. With ``fallback_on_miss`` a ``None`` result is also re-read
+    from the primary: a row created moments ago may not have replicated yet.
+    """
+    if method is None:
+        return functools.partial(read_only, fallback_on_miss=fallback_on_miss)
+
+    def start(session: RoutingSession) -> bool:
+        previous = session.read_only
+        session.read_only, session.replica = True, None
+        return previous
+
+    def should_retry(session: RoutingSession, error: Exception | None, result) -> bool:
+        if session.replica is None:
+            return False
+        if error is not None:
+            session.replicas.mark_down(session.replica)
+            logger.warning(f"⚠️ Read replica failed, using the primary: {error}")
+            return True
+        return fallback_on_miss and result is None
+
+    if inspect.iscoroutinefunction(method):
+
+        @functools.wraps(method)
+        async def async_wrapper(self, *args, **kwargs):
+            session = _routing_session(self.db)
+            if session is None:
+                return await method(self, *args, **kwargs)
+            previous = start(session)
+            try:
+                result, error = await method(self, *args, **kwargs), None
+            except (SQLAlchemyError, DatabaseConnectionError) as e:
+                result, error = None, e
+            finally:
+                session.read_only = previous
+            if should_retry(session, error, result):
+                if error is not None:
+                    await self.db.rollback()
+                return await method(self, *args, **kwargs)
+            if error is not None:
+                raise error
+            return result
+
+        return async_wrapper
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        session = _routing_session(self.db)
+        if session is None:
+            return method(self, *args, **kwargs)
+        previous = start(session)
+        try:
+            result, error = method(self, *args, **kwargs), None
+        except (SQLAlchemyError, DatabaseConnectionError) as e:
+            result, error = None, e
+        finally:
+            session.read_only = previous
+        if should_retry(session, error, result):
+            if error is not None:
+                session.rollback()
+            return method(self, *args, **kwargs)
+        if error is not None:
+            raise error
+        return result
+
+    return wrapper
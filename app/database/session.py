@@ -1,7 +1,18 @@
 import os
-from dotenv import load_dotenv 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, declarative_base 
+from contextlib import contextmanager
+from typing import AsyncIterator, Callable, Iterator
+from dotenv import load_dotenv
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker, declarative_base
+from database.pool import (
+    InstrumentedAsyncQueuePool,
+    InstrumentedQueuePool,
+    instrument_engine,
+)
+from database.query_stats import instrument_queries
+from database.routing import ReplicaSet, RoutingSession
 
 load_dotenv()
 
@@ -11,8 +22,158 @@ DB_HOST = os.getenv("DB_HOST")
 DB_PORT = os.getenv("DB_PORT")
 DB_NAME = os.getenv("DB_NAME")
 
-DATABASE_URL = f"mysql+pymysql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
+DATABASE_URL = os.getenv(
+    "DATABASE_URL",
+    f"mysql+pymysql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}",
+)
+# Used by the async routes; e.g. sqlite+aiosqlite:///./local.db for local runs
+ASYNC_DATABASE_URL = os.getenv(
+    "ASYNC_DATABASE_URL",
+    f"mysql+aiomysql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}",
+)
+# Comma-separated read replicas for @read_only repository methods (sync and
+# async drivers); empty means everything uses the primary
+REPLICA_DATABASE_URLS = [
+    url.strip() for url in os.getenv("REPLICA_DATABASE_URLS", "").split(",") if url.strip()
+]
+ASYNC_REPLICA_DATABASE_URLS = [
+    url.strip()
+    for url in os.getenv("ASYNC_REPLICA_DATABASE_URLS", "").split(",")
+    if url.strip()
+]
+# How long a failed replica is skipped before it is tried again
+REPLICA_RETRY_SECONDS = float(os.getenv("REPLICA_RETRY_SECONDS", "30"))
 
-engine = create_engine(DATABASE_URL, echo=True)
-session = sessionmaker(autoflush=False, bind=engine)
+# Size the pool for the threadpool (40 by default) plus the Celery workers;
+# recycle below MySQL's wait_timeout so idle connections are never stale
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", "30"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+# Logs every statement; per-request numbers come from database/query_stats.py
+SQL_ECHO = os.getenv("SQL_ECHO", "false").lower() == "true"
+
+
+def pool_options(url: str, poolclass: type | None = None) -> dict:
+    # SQLite picks its own pool (one connection per thread or file)
+    if url.startswith("sqlite"):
+        return {}
+    options = {"poolclass": poolclass} if poolclass else {}
+    return options | {
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "pool_timeout": DB_POOL_TIMEOUT,
+        "pool_recycle": DB_POOL_RECYCLE,
+        "pool_pre_ping": True,
+    }
+
+
+@event.listens_for(Engine, "connect")
+def enable_sqlite_foreign_keys(dbapi_connection, connection_record):
+    # SQLite ignores ON DELETE CASCADE unless asked per connection; the ORM
+    # relies on the database cascades (passive_deletes)
+    if "sqlite" in type(dbapi_connection).__module__:
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+
+
+engine = create_engine(
+    DATABASE_URL, echo=SQL_ECHO, **pool_options(DATABASE_URL, InstrumentedQueuePool)
+)
+instrument_engine(engine)
+instrument_queries(engine)
 base = declarative_base()
+
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL,
+    echo=SQL_ECHO,
+    **pool_options(ASYNC_DATABASE_URL, InstrumentedAsyncQueuePool),
+)
+instrument_engine(async_engine.sync_engine)
+instrument_queries(async_engine.sync_engine)
+
+
+def replica_engines(urls: list, create: Callable) -> list:
+    engines = []
+    for url in urls:
+        # Replica pools are not instrumented: their metrics would be summed
+        # into the primary's (metrics live on the pool class)
+        replica = create(url, echo=SQL_ECHO, **pool_options(url))
+        sync_replica = getattr(replica, "sync_engine", replica)
+        instrument_queries(sync_replica)
+        engines.append(replica)
+    return engines
+
+
+replica_engine_list = replica_engines(REPLICA_DATABASE_URLS, create_engine)
+async_replica_engine_list = replica_engines(
+    ASYNC_REPLICA_DATABASE_URLS, create_async_engine
+)
+replicas = (
+    ReplicaSet(replica_engine_list, REPLICA_RETRY_SECONDS)
+    if replica_engine_list
+    else None
+)
+async_replicas = (
+    ReplicaSet(
+        [e.sync_engine for e in async_replica_engine_list], REPLICA_RETRY_SECONDS
+    )
+    if async_replica_engine_list
+    else None
+)
+
+session = sessionmaker(
+    autoflush=False, bind=engine, class_=RoutingSession, replicas=replicas
+)
+# Lazy loads cannot run under asyncio, so objects must stay usable after commit
+async_session = async_sessionmaker(
+    async_engine,
+    autoflush=False,
+    expire_on_commit=False,
+    sync_session_class=RoutingSession,
+    replicas=async_replicas,
+)
+
+
+async def dispose_engines() -> None:
+    """Close the pooled connections of the primary and replica engines"""
+    for pooled in [async_engine, *async_replica_engine_list]:
+        await pooled.dispose()
+    for pooled in [engine, *replica_engine_list]:
+        pooled.dispose()
+
+
+def get_db() -> Iterator[Session]:
+    """Request-scoped session: rolled back on error and always closed"""
+    db = session()
+    try:
+        yield db
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+async def get_async_db() -> AsyncIterator[AsyncSession]:
+    """get_db for async routes"""
+    async with async_session() as db:
+        try:
+            yield db
+        except Exception:
+            await db.rollback()
+            raise
+
+
+@contextmanager
+def session_scope() -> Iterator[Session]:
+    """get_db for code outside a request (Celery tasks, scripts)"""
+    db = session()
+    try:
+        yield db
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
@@ -1,10 +1,25 @@
+import os
+import asyncio
 from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi import status
 from contextlib import asynccontextmanager
-from database.session import engine, base
+from sqlalchemy import text
+from starlette.concurrency import run_in_threadpool
+from database.session import (
+    DB_POOL_SIZE,
+    async_engine,
+    async_replicas,
+    dispose_engines,
+    engine,
+    replicas,
+)
+from database.pool import pool_stats, prefill_async_pool, prefill_pool
+from database.query_stats import QueryStatsMiddleware
+from database.redis import redis_client
 from core.logger import logger
+from core.startup import startup_state
 
 from core.exception_handler import setup_exception_handlers
 from fastapi.exceptions import RequestValidationError
@@ -16,17 +31,58 @@ from modules.admin.auth.controller import router as admin_auth_router
 from modules.admin.users.controller import router as admin_users_router
 
 from app.database.init_db import init_models
+from modules.story.model_registry import warm_up
+from modules.story.executor import nlp_executor
+from modules.story.cache import segmentation_cache
+
+# Production schemas come from Alembic; create_all only for local setups
+AUTO_CREATE_TABLES = (
+    os.getenv(
+        "AUTO_CREATE_TABLES",
+        "false" if os.getenv("ENVIROMENT") == "production" else "true",
+    ).lower()
+    == "true"
+)
+NLP_WARMUP = os.getenv("NLP_WARMUP", "true").lower() == "true"
+# Connections opened per pool during warm-up
+DB_POOL_WARM = int(os.getenv("DB_POOL_WARM", str(DB_POOL_SIZE)))
+HEALTH_CHECK_TIMEOUT = float(os.getenv("HEALTH_CHECK_TIMEOUT", "2"))
+# Warm-up phases an instance cannot serve segmentation without; the database
+# and Redis are pinged on every readiness check instead
+REQUIRED_PHASES = ("nlp_model", "nlp_pool")
+
+
+async def warm_up_app() -> None:
+    """Runs once the app is serving; /health/ready waits for it"""
+    if not startup_state.failed("database"):
+        with startup_state.phase("db_pool") as details:
+            details["sync"] = await run_in_threadpool(prefill_pool, engine, DB_POOL_WARM)
+            details["async"] = await prefill_async_pool(async_engine, DB_POOL_WARM)
+    with startup_state.phase("redis"):
+        await run_in_threadpool(redis_client.ping)
+    if NLP_WARMUP:
+        with startup_state.phase("nlp_model") as details:
+            details.update(await run_in_threadpool(warm_up))
+        with startup_state.phase("nlp_pool") as details:
+            await run_in_threadpool(nlp_executor.warm)
+            details["workers"] = nlp_executor.max_workers
+    startup_state.finish_warm_up()
+
 
 @asynccontextmanager
 async def startup_event(app: FastAPI):
-    try:
-        with engine.connect() as conn:
+    with startup_state.phase("database"):
+        with engine.connect():
             logger.info("✅ Database connected successfully!")
-        init_models()
-        base.metadata.create_all(bind=engine)
-        yield
-    except Exception as e:
-        logger.error(f"❌ Database connection failed: {e}")
+    if AUTO_CREATE_TABLES and not startup_state.failed("database"):
+        with startup_state.phase("create_tables"):
+            init_models()
+    # Serve /health/live right away; the slow part runs in the background
+    warm_up_task = asyncio.create_task(warm_up_app())
+    yield
+    warm_up_task.cancel()
+    nlp_executor.shutdown()
+    await dispose_engines()
 
 
 app = FastAPI(lifespan=startup_event, title="Animatic-Vision")
@@ -42,7 +98,15 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[
+        "X-DB-Query-Count",
+        "X-DB-Time-Ms",
+        "X-DB-Slowest-Ms",
+        "X-DB-N-Plus-One",
+        "Server-Timing",
+    ],
 )
+app.add_middleware(QueryStatsMiddleware)
 
 setup_exception_handlers(app)
 app.include_router(auth_router)
@@ -57,6 +121,63 @@ def home():
     return {"status": "Server is running"}
 
 
+@app.get("/health/live")
+def health_live():
+    return {"status": "alive", "uptime_seconds": startup_state.stats()["uptime_seconds"]}
+
+
+async def _ping_database() -> None:
+    async with async_engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+
+
+async def _check(ping) -> bool:
+    try:
+        await asyncio.wait_for(ping(), HEALTH_CHECK_TIMEOUT)
+        return True
+    except Exception as e:
+        logger.warning(f"⚠️ Readiness check failed: {e!r}")
+        return False
+
+
+@app.get("/health/ready")
+async def health_ready():
+    """200 once warm-up is done without a required phase failing and the
+    database and Redis answer"""
+    checks = {
+        "warm_up": startup_state.warmed_up,
+        "nlp": not startup_state.failed_phases(REQUIRED_PHASES),
+        "database": await _check(_ping_database),
+        "redis": await _check(lambda: run_in_threadpool(redis_client.ping)),
+    }
+    ready = all(checks.values())
+    return JSONResponse(
+        status_code=status.HTTP_200_OK if ready else status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={
+            "status": "ready" if ready else "not_ready",
+            "checks": checks,
+            "startup": startup_state.stats(),
+        },
+    )
+
+
+@app.get("/metrics/nlp")
+def nlp_metrics():
+    return {"pool": nlp_executor.stats(), "cache": segmentation_cache.stats()}
+
+
+@app.get("/metrics/db-pool")
+def db_pool_metrics():
+    return {
+        "sync": pool_stats(engine),
+        "async": pool_stats(async_engine.sync_engine),
+        "replicas": {
+            "sync": replicas.stats() if replicas else None,
+            "async": async_replicas.stats() if async_replicas else None,
+        },
+    }
+
+
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
     error = exc.errors()[0]
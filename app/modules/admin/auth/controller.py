@@ -1,5 +1,8 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from modules.admin.auth.schemas import AdminLoginRequest, AdminRegisterRequest
+from sqlalchemy.orm import Session
+from database.session import get_db
+from modules.admin.auth.repository import AdminAuthRepository
 from modules.admin.auth.service import AdminAuthService
 from core.middleware import is_authenticated, get_refresh_token
 from database.redis import redis_client
@@ -9,8 +12,8 @@ from datetime import datetime, UTC
 router = APIRouter(prefix="/admin/auth", tags=["Admin Auth"])
 
 
-def get_admin_auth_service():
-    return AdminAuthService()
+def get_admin_auth_service(db: Session = Depends(get_db)):
+    return AdminAuthService(AdminAuthRepository(db))
 
 
 def assert_admin(user: dict):
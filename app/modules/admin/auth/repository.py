@@ -1,5 +1,5 @@
 from core.logger import logger
-from database.session import session
+from sqlalchemy.orm import Session
 from app.database.models.user import User, UserRole
 from sqlalchemy.exc import SQLAlchemyError, IntegrityError
 from core.exceptions import (
@@ -8,11 +8,12 @@ from core.exceptions import (
     UserAlreadyExistsError,
 )
 from core.security import verify_password
+from database.routing import read_only
 
 
 class AdminAuthRepository:
-    def __init__(self):
-        self.db = session()
+    def __init__(self, db: Session):
+        self.db = db
 
     def login_admin(self, email: str, password: str) -> User:
         try:
@@ -33,6 +34,7 @@ class AdminAuthRepository:
             logger.error(f"Database error during admin login: {str(e)}")
             raise DatabaseConnectionError()
 
+    @read_only(fallback_on_miss=True)
     def me_admin(self, email: str) -> User | None:
         try:
             user = (
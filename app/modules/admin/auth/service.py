@@ -9,7 +9,7 @@ from core.security import password_hashing
 
 
 class AdminAuthService:
-    def __init__(self, repo: AdminAuthRepository = AdminAuthRepository()):
+    def __init__(self, repo: AdminAuthRepository):
         self.repo = repo
 
     def login(self, email: str, password: str):
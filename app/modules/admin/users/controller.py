@@ -1,20 +1,25 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from core.middleware import is_authenticated
 from modules.admin.users.schemas import (
+    AdminBulkRoleRequest,
+    AdminBulkUsersRequest,
     AdminCreateUserRequest,
     AdminUpdateUserRequest,
     AdminUpdateUserRoleRequest,
     AdminUpdatePasswordRequest,
     AdminUserListQuery,
 )
+from sqlalchemy.orm import Session
+from database.session import get_db
+from modules.admin.users.repository import AdminUserRepository
 from modules.admin.users.service import AdminUserService
 
 
 router = APIRouter(prefix="/admin/users", tags=["Admin Users"])
 
 
-def get_service():
-    return AdminUserService()
+def get_service(db: Session = Depends(get_db)):
+    return AdminUserService(AdminUserRepository(db))
 
 
 def assert_admin(user: dict):
@@ -34,6 +39,36 @@ def list_users(
     return service.list_users(query)
 
 
+@router.post("/bulk/delete")
+def bulk_delete_users(
+    payload: AdminBulkUsersRequest,
+    user: dict = Depends(is_authenticated),
+    service: AdminUserService = Depends(get_service),
+):
+    assert_admin(user)
+    return service.bulk_delete(payload, user.get("id"))
+
+
+@router.post("/bulk/role")
+def bulk_update_user_role(
+    payload: AdminBulkRoleRequest,
+    user: dict = Depends(is_authenticated),
+    service: AdminUserService = Depends(get_service),
+):
+    assert_admin(user)
+    return service.bulk_update_role(payload, user.get("id"))
+
+
+@router.post("/bulk/password-reset")
+def bulk_require_password_reset(
+    payload: AdminBulkUsersRequest,
+    user: dict = Depends(is_authenticated),
+    service: AdminUserService = Depends(get_service),
+):
+    assert_admin(user)
+    return service.bulk_require_password_reset(payload)
+
+
 @router.get("/{user_id}")
 def get_user(
     user_id: int,
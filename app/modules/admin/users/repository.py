@@ -1,39 +1,125 @@
-from typing import List, Tuple
+import os
+import re
+from datetime import datetime
+from typing import Iterator, List, Tuple
+from sqlalchemy import delete, func, or_, text, update
+from sqlalchemy.dialects.mysql import match
 from sqlalchemy.exc import SQLAlchemyError, IntegrityError
-from sqlalchemy.orm import Query
+from sqlalchemy.orm import Query, Session
+from core.pagination import keyset_before
+from database.routing import read_only
 from core.logger import logger
 from core.exceptions import DatabaseConnectionError, UserAlreadyExistsError
-from database.session import session
 from app.database.models.user import User, UserRole
 
 
+# innodb_ft_min_token_size; shorter words are not in the FULLTEXT index
+FULLTEXT_MIN_TOKEN = 3
+_FULLTEXT_DELIMITERS = re.compile(r"[^\w]+")
+
+
+def fulltext_terms(search: str) -> str | None:
+    """Boolean-mode query requiring every word of ``search`` as a prefix"""
+    words = [w for w in _FULLTEXT_DELIMITERS.split(search) if len(w) >= FULLTEXT_MIN_TOKEN]
+    return " ".join(f"+{w}*" for w in words) or None
+
+
+# Rows per UPDATE/DELETE in bulk operations; each chunk commits on its own so
+# locks stay short and replicas keep up
+ADMIN_BULK_CHUNK_SIZE = int(os.getenv("ADMIN_BULK_CHUNK_SIZE", "1000"))
+
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
 class AdminUserRepository:
-    def __init__(self):
-        self.db = session()
+    def __init__(self, db: Session):
+        self.db = db
 
     def _base_query(self) -> Query:
         return self.db.query(User)
 
+    @read_only
     def list_users(
-        self, search: str | None, role: str | None, page: int, limit: int
-    ) -> Tuple[List[User], int]:
+        self,
+        search: str | None,
+        role: str | None,
+        limit: int,
+        after: Tuple[datetime, int] | None = None,
+    ) -> List[User]:
+        """Newest-first page of users, keyset paginated on (created_at, id)"""
         try:
-            q = self._base_query()
-            if search:
-                like = f"%{search}%"
-                q = q.filter((User.fullName.ilike(like)) | (User.email.ilike(like)))
-            if role in {"admin", "user"}:
-                q = q.filter(User.role == UserRole(role))
-
-            total = q.count()
-            items = q.order_by(User.created_at.desc()).offset((page - 1) * limit).limit(limit).all()
-            return items, total
+            q = self._filtered_query(search, role)
+            if after:
+                q = q.filter(keyset_before(User.created_at, User.id, after))
+            return q.order_by(User.created_at.desc(), User.id.desc()).limit(limit).all()
         except SQLAlchemyError as e:
             self.db.rollback()
             logger.error(f"Database error listing users: {str(e)}")
             raise DatabaseConnectionError()
 
+    @read_only
+    def count_users(self, search: str | None, role: str | None) -> int:
+        try:
+            q = self._filtered_query(search, role).with_entities(func.count(User.id))
+            return q.order_by(None).scalar()
+        except SQLAlchemyError as e:
+            self.db.rollback()
+            logger.error(f"Database error counting users: {str(e)}")
+            raise DatabaseConnectionError()
+
+    @read_only
+    def estimate_users(self) -> int | None:
+        """Row estimate from table statistics (MySQL only; no table scan)"""
+        if self.db.get_bind().dialect.name != "mysql":
+            return None
+        try:
+            return self.db.execute(
+                text(
+                    "SELECT TABLE_ROWS FROM information_schema.TABLES "
+                    "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table"
+                ),
+                {"table": User.__tablename__},
+            ).scalar()
+        except SQLAlchemyError as e:
+            self.db.rollback()
+            logger.error(f"Database error estimating users: {str(e)}")
+            raise DatabaseConnectionError()
+
+    def _filtered_query(self, search: str | None, role: str | None) -> Query:
+        q = self._base_query()
+        if search:
+            q = q.filter(self._search_clause(search))
+        if role in {"admin", "user"}:
+            q = q.filter(User.role == UserRole(role))
+        return q
+
+    def _search_clause(self, search: str):
+        """Which users match ``search``, per dialect.
+
+        MySQL: the FULLTEXT index over fullName and email, every word of at
+        least FULLTEXT_MIN_TOKEN characters required as a word prefix, so
+        "smith" finds "John Smith" and "example" finds "a@example.com".
+        Searches with no such word, and every other dialect: a substring
+        match (``%q%``) on fullName or email, which reads the whole table.
+        """
+        if self.db.get_bind().dialect.name == "mysql":
+            terms = fulltext_terms(search)
+            if terms:
+                return match(User.fullName, User.email, against=terms).in_boolean_mode()
+        like = f"%{_escape_like(search.strip())}%"
+        return or_(
+            User.fullName.ilike(like, escape="\\"),
+            User.email.ilike(like, escape="\\"),
+        )
+
+    @read_only(fallback_on_miss=True)
     def get_user(self, user_id: int) -> User | None:
+        return self._find_user(user_id)
+
+    def _find_user(self, user_id: int) -> User | None:
+        # Updates and deletes read the row from the primary
         try:
             return self._base_query().filter(User.id == user_id).first()
         except SQLAlchemyError as e:
@@ -65,7 +151,7 @@ class AdminUserRepository:
         password_hash: str | None,
     ) -> User | None:
         try:
-            u = self.get_user(user_id)
+            u = self._find_user(user_id)
             if not u:
                 return None
             if full_name is not None:
@@ -76,6 +162,7 @@ class AdminUserRepository:
                 u.role = UserRole(role)
             if password_hash is not None:
                 u.password = password_hash
+                u.password_reset_required = False
             self.db.commit()
             self.db.refresh(u)
             return u
@@ -96,7 +183,7 @@ class AdminUserRepository:
 
     def delete_user(self, user_id: int) -> bool:
         try:
-            u = self.get_user(user_id)
+            u = self._find_user(user_id)
             if not u:
                 return False
             self.db.delete(u)
@@ -107,4 +194,68 @@ class AdminUserRepository:
             logger.error(f"Database error delete user: {str(e)}")
             raise DatabaseConnectionError()
 
+    def bulk_delete(self, chunks: Iterator[List[int]]) -> dict:
+        """DELETE by id, chunk by chunk. Projects, scenes and assets go with
+        the users through the ON DELETE CASCADE foreign keys."""
+        return self._apply_in_chunks(
+            chunks, lambda ids: delete(User).where(User.id.in_(ids))
+        )
+
+    def bulk_update_role(self, chunks: Iterator[List[int]], role: str) -> dict:
+        new_role = UserRole(role)
+        return self._apply_in_chunks(
+            chunks,
+            lambda ids: update(User)
+            .where(User.id.in_(ids), User.role != new_role)
+            .values(role=new_role),
+        )
+
+    def bulk_require_password_reset(self, chunks: Iterator[List[int]]) -> dict:
+        return self._apply_in_chunks(
+            chunks,
+            lambda ids: update(User)
+            .where(User.id.in_(ids), User.password_reset_required.is_(False))
+            .values(password_reset_required=True),
+        )
+
+    def id_chunks(
+        self, ids: List[int], exclude_id: int | None = None
+    ) -> Iterator[List[int]]:
+        ids = sorted(set(ids) - {exclude_id})
+        for start in range(0, len(ids), ADMIN_BULK_CHUNK_SIZE):
+            yield ids[start : start + ADMIN_BULK_CHUNK_SIZE]
 
+    def filter_chunks(
+        self, search: str | None, role: str | None, exclude_id: int | None = None
+    ) -> Iterator[List[int]]:
+        """Ids matching the list filters, walked in primary-key order"""
+        last_id = 0
+        while True:
+            q = self._filtered_query(search, role).with_entities(User.id)
+            q = q.filter(User.id > last_id)
+            if exclude_id is not None:
+                q = q.filter(User.id != exclude_id)
+            ids = [row.id for row in q.order_by(User.id).limit(ADMIN_BULK_CHUNK_SIZE)]
+            if not ids:
+                return
+            yield ids
+            last_id = ids[-1]
+
+    def _apply_in_chunks(self, chunks: Iterator[List[int]], statement) -> dict:
+        targeted = affected = batches = 0
+        try:
+            for ids in chunks:
+                result = self.db.execute(
+                    statement(ids).execution_options(synchronize_session=False)
+                )
+                self.db.commit()
+                targeted += len(ids)
+                affected += result.rowcount
+                batches += 1
+        except SQLAlchemyError as e:
+            self.db.rollback()
+            logger.error(f"Database error in bulk user operation: {str(e)}")
+            raise DatabaseConnectionError(
+                detail=f"Bulk operation stopped after {affected} users"
+            )
+        return {"targeted": targeted, "affected": affected, "chunks": batches}
@@ -1,11 +1,13 @@
-from pydantic import BaseModel, EmailStr, Field
+from typing import List
+from pydantic import BaseModel, EmailStr, Field, model_validator
 
 
 class AdminUserListQuery(BaseModel):
-    q: str | None = None
+    q: str | None = Field(default=None, max_length=100)
     role: str | None = Field(default=None, pattern="^(admin|user)$")
-    page: int = Field(default=1, ge=1)
+    cursor: str | None = None
     limit: int = Field(default=10, ge=1, le=100)
+    withTotal: bool = False
 
 
 class AdminCreateUserRequest(BaseModel):
@@ -30,3 +32,33 @@ class AdminUpdatePasswordRequest(BaseModel):
     password: str
 
 
+
+
+class AdminUserFilter(BaseModel):
+    """Same filters as the user list; at least one is required"""
+
+    q: str | None = Field(default=None, min_length=1, max_length=100)
+    role: str | None = Field(default=None, pattern="^(admin|user)$")
+
+    @model_validator(mode="after")
+    def not_everyone(self):
+        if not self.q and not self.role:
+            raise ValueError("filter needs q or role")
+        return self
+
+
+class AdminBulkUsersRequest(BaseModel):
+    """Target users by ``ids`` or by ``filter`` (exactly one)"""
+
+    ids: List[int] | None = Field(default=None, min_length=1, max_length=10000)
+    filter: AdminUserFilter | None = None
+
+    @model_validator(mode="after")
+    def ids_or_filter(self):
+        if (self.ids is None) == (self.filter is None):
+            raise ValueError("provide either ids or filter")
+        return self
+
+
+class AdminBulkRoleRequest(AdminBulkUsersRequest):
+    role: str = Field(pattern="^(admin|user)$")
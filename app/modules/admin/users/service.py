@@ -1,21 +1,39 @@
+import os
+import hashlib
+from typing import Iterator, List, Tuple
+from redis.exceptions import RedisError
+from core.logger import logger
+from core.pagination import decode_cursor, encode_cursor
 from core.response import ApiResponse
 from core.security import password_hashing
 from modules.admin.users.repository import AdminUserRepository
 from modules.admin.users.schemas import (
+    AdminBulkRoleRequest,
+    AdminBulkUsersRequest,
     AdminCreateUserRequest,
     AdminUpdateUserRequest,
     AdminUserListQuery,
 )
+from database.redis import redis_client
+
+ADMIN_TOTAL_KEY = "admin-users-total:"
+ADMIN_TOTAL_TTL = int(os.getenv("ADMIN_USERS_TOTAL_TTL", "60"))
 
 
 class AdminUserService:
-    def __init__(self, repo: AdminUserRepository = AdminUserRepository()):
+    def __init__(self, repo: AdminUserRepository):
         self.repo = repo
 
     def list_users(self, query: AdminUserListQuery):
-        users, total = self.repo.list_users(
-            search=query.q, role=query.role, page=query.page, limit=query.limit
+        try:
+            after = decode_cursor(query.cursor) if query.cursor else None
+        except ValueError as e:
+            return ApiResponse(message=str(e), status_code=400)
+        # One extra row tells whether another page exists
+        users = self.repo.list_users(
+            search=query.q, role=query.role, limit=query.limit + 1, after=after
         )
+        page = users[: query.limit]
         data = {
             "items": [
                 {
@@ -26,14 +44,47 @@ class AdminUserService:
                     "created_at": str(u.created_at),
                     "updated_at": str(u.updated_at),
                 }
-                for u in users
+                for u in page
             ],
-            "total": total,
-            "page": query.page,
+            "next_cursor": (
+                encode_cursor(page[-1].created_at, page[-1].id)
+                if len(users) > query.limit
+                else None
+            ),
             "limit": query.limit,
         }
+        if query.withTotal:
+            data["total"], data["total_estimated"] = self.total_users(query.q, query.role)
         return ApiResponse(message="Users fetched successfully", status_code=200, data=data)
 
+    def total_users(self, search: str | None, role: str | None) -> Tuple[int, bool]:
+        """(total, is_estimate) for the list header.
+
+        The unfiltered total comes from table statistics; filtered counts
+        are exact but cached in Redis for a short while.
+        """
+        if not search and not role:
+            estimate = self.repo.estimate_users()
+            if estimate is not None:
+                return estimate, True
+
+        key = ADMIN_TOTAL_KEY + hashlib.sha1(
+            f"{search or ''}|{role or ''}".encode("utf-8")
+        ).hexdigest()
+        try:
+            cached = redis_client.get(key)
+            if cached is not None:
+                return int(cached), False
+        except RedisError as e:
+            logger.warning(f"Admin user count cache read failed: {e}")
+
+        total = self.repo.count_users(search, role)
+        try:
+            redis_client.setex(key, ADMIN_TOTAL_TTL, total)
+        except RedisError as e:
+            logger.warning(f"Admin user count cache write failed: {e}")
+        return total, False
+
     def get_user(self, user_id: int):
         u = self.repo.get_user(user_id)
         if not u:
@@ -105,4 +156,32 @@ class AdminUserService:
             return ApiResponse(message="User not found", status_code=404)
         return ApiResponse(message="User deleted", status_code=200, data=None)
 
+    def bulk_delete(self, payload: AdminBulkUsersRequest, acting_admin_id: int | None):
+        result = self.repo.bulk_delete(self._targets(payload, acting_admin_id))
+        return ApiResponse(
+            message=f"{result['affected']} users deleted", status_code=200, data=result
+        )
+
+    def bulk_update_role(self, payload: AdminBulkRoleRequest, acting_admin_id: int | None):
+        result = self.repo.bulk_update_role(
+            self._targets(payload, acting_admin_id), payload.role
+        )
+        return ApiResponse(
+            message=f"{result['affected']} users updated", status_code=200, data=result
+        )
+
+    def bulk_require_password_reset(self, payload: AdminBulkUsersRequest):
+        result = self.repo.bulk_require_password_reset(self._targets(payload))
+        return ApiResponse(
+            message=f"{result['affected']} users must reset their password",
+            status_code=200,
+            data=result,
+        )
 
+    def _targets(
+        self, payload: AdminBulkUsersRequest, exclude_id: int | None = None
+    ) -> Iterator[List[int]]:
+        # The acting admin never deletes or demotes themselves in bulk
+        if payload.ids is not None:
+            return self.repo.id_chunks(payload.ids, exclude_id)
+        return self.repo.filter_chunks(payload.filter.q, payload.filter.role, exclude_id)
@@ -6,6 +6,9 @@ from modules.auth.schemas import (
     ForgotPasswordRequest,
     ResetPasswordRequest,
 )
+from sqlalchemy.ext.asyncio import AsyncSession
+from database.session import get_async_db
+from modules.auth.repository import AuthRepository
 from modules.auth.service import AuthService
 from core.middleware import is_authenticated, get_refresh_token
 from datetime import datetime, UTC
@@ -15,22 +18,22 @@ from core.response import ApiResponse
 router = APIRouter(prefix="/auth", tags=["Auth"])
 
 
-def get_auth_service():
-    return AuthService()
+def get_auth_service(db: AsyncSession = Depends(get_async_db)):
+    return AuthService(AuthRepository(db))
 
 
 @router.post("/register")
 async def register_user(
     request: RegisterRequest, service: AuthService = Depends(get_auth_service)
 ):
-    return service.register(request)
+    return await service.register(request)
 
 
 @router.post("/login")
 async def login_user(
     request: LoginRequest, service: AuthService = Depends(get_auth_service)
 ):
-    return service.login(request.email, request.password)
+    return await service.login(request.email, request.password)
 
 
 @router.get("/refresh-token")
@@ -62,7 +65,7 @@ async def me(
     user: dict = Depends(is_authenticated),
     service: AuthService = Depends(get_auth_service),
 ):
-    return service.me(user["email"])
+    return await service.me(user["email"])
 
 
 @router.put("/change-password")
@@ -71,7 +74,7 @@ async def change_password(
     user: dict = Depends(is_authenticated),
     service: AuthService = Depends(get_auth_service),
 ):
-    return service.changed_password(
+    return await service.changed_password(
         user["email"], request.old_password, request.new_password
     )
 
@@ -82,7 +85,7 @@ async def forgot_password(
     service: AuthService = Depends(get_auth_service),
 ):
     print(request)
-    return service.forget_password(request.email)
+    return await service.forget_password(request.email)
 
 
 @router.post("/reset-password")
@@ -90,4 +93,4 @@ async def reset_password(
     request: ResetPasswordRequest,
     service: AuthService = Depends(get_auth_service),
 ):
-    return service.reset_password(request.token, request.newPassword)
+    return await service.reset_password(request.token, request.newPassword)
@@ -1,6 +1,8 @@
 from core.logger import logger
 from core.exceptions import HTTPException
-from database.session import session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
 from app.database.models.user import User
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from core.exceptions import (
@@ -9,36 +11,42 @@ from core.exceptions import (
     InvalidCredentialsError,
 )
 from core.security import verify_password, password_hashing
+from database.routing import read_only
 
 
 class AuthRepository:
-    def __init__(self):
-        self.db = session()
+    def __init__(self, db: AsyncSession):
+        self.db = db
 
-    def create_user(self, fullName, email, password):
+    async def _get_by_email(self, email: str) -> User | None:
+        result = await self.db.execute(select(User).where(User.email == email))
+        return result.scalar_one_or_none()
+
+    async def create_user(self, fullName, email, password):
         try:
             user = User(fullName=fullName, email=email, password=password)
             self.db.add(user)
-            self.db.commit()
-            self.db.refresh(user)
+            await self.db.commit()
+            await self.db.refresh(user)
             return user
 
         except IntegrityError:
-            self.db.rollback()
+            await self.db.rollback()
             logger.warning(f"Duplicate email detected: {email}")
             raise UserAlreadyExistsError(email)
 
         except SQLAlchemyError as e:
-            self.db.rollback()
+            await self.db.rollback()
             logger.error(f"Database error during user creation: {str(e)}")
             raise DatabaseConnectionError()
 
-    def login_user(self, email, password):
+    async def login_user(self, email, password):
         try:
-            user = self.db.query(User).filter(User.email == email).first()
+            user = await self._get_by_email(email)
             if not user:
                 raise InvalidCredentialsError(message="Invalid email")
-            flag = verify_password(user.password, password)
+            # argon2 is CPU bound; keep it off the event loop
+            flag = await run_in_threadpool(verify_password, user.password, password)
             if flag:
                 return user
             else:
@@ -48,64 +56,67 @@ class AuthRepository:
             raise InvalidCredentialsError()
 
         except SQLAlchemyError as e:
-            self.db.rollback()
+            await self.db.rollback()
             logger.error(f"Database error during user creation: {str(e)}")
             raise DatabaseConnectionError()
 
-    def me(self, email: str):
+    @read_only(fallback_on_miss=True)
+    async def me(self, email: str):
         try:
-            user = self.db.query(User).filter(User.email == email).first()
+            user = await self._get_by_email(email)
             return user
         except SQLAlchemyError as e:
-            self.db.rollback()
+            await self.db.rollback()
             logger.error(f"Database error during user creation: {str(e)}")
             raise DatabaseConnectionError()
 
-    def change_password(self, email: str, old_password: str, new_password: str):
+    async def change_password(self, email: str, old_password: str, new_password: str):
         try:
-            user = self.db.query(User).filter(User.email == email).first()
+            user = await self._get_by_email(email)
 
             if not user:
                 raise HTTPException(status_code=404, detail="User not found")
 
-            if not verify_password(user.password, old_password):
+            if not await run_in_threadpool(verify_password, user.password, old_password):
                 raise HTTPException(status_code=400, detail="Old password is incorrect")
 
-            hash = password_hashing(new_password)
+            hash = await run_in_threadpool(password_hashing, new_password)
             user.password = hash
-            self.db.commit()
-            self.db.refresh(user)
+            user.password_reset_required = False
+            await self.db.commit()
+            await self.db.refresh(user)
             logger.info(f"Password changed successfully for user {email}")
             return True
         except SQLAlchemyError as e:
-            self.db.rollback()
+            await self.db.rollback()
             logger.error(f"Database error during user creation: {str(e)}")
             raise DatabaseConnectionError()
 
-    def forget_password(self, email: str):
+    async def forget_password(self, email: str):
         try:
-            user = self.db.query(User).filter(User.email == email).first()
+            user = await self._get_by_email(email)
             if not user:
                 raise HTTPException(status_code=404, detail="User not found")
             return True
         except SQLAlchemyError as e:
-            self.db.rollback()
+            await self.db.rollback()
             logger.error(f"Database error during user forgetting password: {str(e)}")
             raise DatabaseConnectionError()
 
-    def reset_password(self, email: str, new_password: str):
+    async def reset_password(self, email: str, new_password: str):
         try:
-            user = self.db.query(User).filter(User.email == email).first()
+            user = await self._get_by_email(email)
             if not user:
                 raise HTTPException(status_code=404, detail="User not found")
 
-            hash = password_hashing(new_password)
+            hash = await run_in_threadpool(password_hashing, new_password)
             user.password = hash
-            self.db.commit()
-            self.db.refresh(user)
+            user.password_reset_required = False
+            await self.db.commit()
+            await self.db.refresh(user)
             return True
 
         except SQLAlchemyError as e:
-            self.db.rollback()
+            await self.db.rollback()
             logger.error(f"Database error during user resetting password: {str(e)}")
             raise DatabaseConnectionError()
@@ -7,18 +7,19 @@ from core.response import ApiResponse
 from tasks.email_tasks import send_reset_password_link
 from core.security import verify_token
 from fastapi.responses import JSONResponse
+from starlette.concurrency import run_in_threadpool
 from dotenv import load_dotenv
 
 load_dotenv()
 
 
 class AuthService:
-    def __init__(self, repo: AuthRepository = AuthRepository()):
+    def __init__(self, repo: AuthRepository):
         self.repo = repo
 
-    def register(self, data: RegisterRequest) -> RegisterResponse:
-        hash = password_hashing(data.password)
-        user = self.repo.create_user(data.fullName, data.email, hash)
+    async def register(self, data: RegisterRequest) -> RegisterResponse:
+        hash = await run_in_threadpool(password_hashing, data.password)
+        user = await self.repo.create_user(data.fullName, data.email, hash)
         return RegisterResponse(
             id=user.id,
             fullName=user.fullName,
@@ -28,8 +29,8 @@ class AuthService:
             updated_at=user.updated_at,
         )
 
-    def login(self, email: str, password: str) -> LoginResponse:
-        user = self.repo.login_user(email, password)
+    async def login(self, email: str, password: str) -> LoginResponse:
+        user = await self.repo.login_user(email, password)
         if user:
             access_token = generate_token(user.id, user.fullName, user.email, user.role)
             refresh_token = generate_refresh_token(
@@ -44,6 +45,7 @@ class AuthService:
                         "fullName": user.fullName,
                         "email": user.email,
                         "role": user.role.value,
+                        "password_reset_required": user.password_reset_required,
                         "created_at": (
                             user.created_at.isoformat() if user.created_at else None
                         ),
@@ -71,37 +73,39 @@ class AuthService:
             )
             return response
 
-    def me(self, email: str):
-        user = self.repo.me(email)
+    async def me(self, email: str):
+        user = await self.repo.me(email)
         data = {
             "id": user.id,
             "fullName": user.fullName,
             "email": user.email,
             "role": user.role,
+            "password_reset_required": user.password_reset_required,
             "created_at": user.created_at,
             "updated_at": user.updated_at,
         }
         return ApiResponse(message="User data", status_code=200, data=data)
 
-    def changed_password(self, email: str, old_password: str, new_password: str):
-        flag = self.repo.change_password(email, old_password, new_password)
+    async def changed_password(self, email: str, old_password: str, new_password: str):
+        flag = await self.repo.change_password(email, old_password, new_password)
         if flag:
             return ApiResponse(
                 message=f"Password changed successfully for user {email}"
             )
 
-    def forget_password(self, email: str):
-        flag = self.repo.forget_password(email)
+    async def forget_password(self, email: str):
+        flag = await self.repo.forget_password(email)
         if flag:
             token = jwt.encode(
                 {"email": email}, os.getenv("SECRET_KEY"), algorithm="HS256"
             )
-            send_reset_password_link(email, token)
+            # Sends over SMTP right away, so keep it off the event loop
+            await run_in_threadpool(send_reset_password_link, email, token)
             return ApiResponse(message="Password reset email sent successfully")
 
-    def reset_password(self, token: str, new_password: str):
+    async def reset_password(self, token: str, new_password: str):
         decode = jwt.decode(token, os.getenv("SECRET_KEY"), algorithms="HS256")
-        flag = self.repo.reset_password(decode["email"], new_password)
+        flag = await self.repo.reset_password(decode["email"], new_password)
         if flag:
             return ApiResponse(message="Password reset successfully")
 
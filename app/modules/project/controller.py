@@ -1,23 +1,25 @@
 # backend/app/modules/project/controller.py
 from fastapi import APIRouter, Depends, HTTPException, status
 from core.middleware import is_authenticated
+from sqlalchemy.ext.asyncio import AsyncSession
+from database.session import get_async_db
 from modules.project.service import ProjectService
-from modules.project.schemas import ProjectCreate, ProjectStatusUpdate
+from modules.project.schemas import ProjectCreate, ProjectListQuery, ProjectStatusUpdate
 from app.database.models.project import Project
 
 
 router = APIRouter(prefix="/projects", tags=["Projects"])
 
-def get_project_service():
-    return ProjectService()
+def get_project_service(db: AsyncSession = Depends(get_async_db)):
+    return ProjectService(db)
 
 @router.post("/")
-def create_project(
+async def create_project(
     request: ProjectCreate,
     user: dict = Depends(is_authenticated),
     service: ProjectService = Depends(get_project_service),
 ):
-    return service.create_project(
+    return await service.create_project(
         user_id=user["id"],
         title=request.title,
         story_text=request.story_text,
@@ -25,22 +27,31 @@ def create_project(
     )
 
 @router.get("/{project_id}")
-def get_project(
+async def get_project(
     project_id: int,
+    projection: bool = True,
     user: dict = Depends(is_authenticated),
     service: ProjectService = Depends(get_project_service),
 ):
-    result = service.get_project(project_id=project_id, user_id=user["id"])
+    result = await service.get_project(
+        project_id=project_id, user_id=user["id"], projection=projection
+    )
     if result.status_code != 200:
         raise HTTPException(status_code=result.status_code, detail=result.message)
     return result.data
 
 @router.get("/")
-def get_projects(
+async def get_projects(
+    query: ProjectListQuery = Depends(),
     user: dict = Depends(is_authenticated),
     service: ProjectService = Depends(get_project_service),
 ):
-    result = service.get_projects(user_id=user["id"])
+    result = await service.get_projects(
+        user_id=user["id"],
+        limit=query.limit,
+        cursor=query.cursor,
+        with_scene_count=query.withSceneCount,
+    )
     if result.status_code != 200:
         raise HTTPException(status_code=result.status_code, detail=result.message)
     return result.data
@@ -48,13 +59,13 @@ def get_projects(
 @router.patch(
     "/{project_id}/status",
 )
-def update_project_status(
+async def update_project_status(
     project_id: int,
     request: ProjectStatusUpdate,
     user: dict = Depends(is_authenticated),
     service: ProjectService = Depends(get_project_service),
 ):
-    project: Project | None = service.repo.get_by_id(
+    project: Project | None = await service.repo.get_by_id(
         project_id=project_id, user_id=user["id"]
     )
     if not project:
@@ -63,7 +74,9 @@ def update_project_status(
             detail="Project not found or you don't have access",
         )
 
-    result = service.update_project_status(project=project, new_status=request.status)
+    result = await service.update_project_status(
+        project=project, new_status=request.status
+    )
     if result.status_code != 200:
         raise HTTPException(status_code=result.status_code, detail=result.message)
     return result.data
@@ -72,12 +85,12 @@ def update_project_status(
 @router.delete(
     "/{project_id}",
 )
-def delete_project(
+async def delete_project(
     project_id: int,
     user: dict = Depends(is_authenticated),
     service: ProjectService = Depends(get_project_service),
 ):
-    project: Project | None = service.repo.get_by_id(
+    project: Project | None = await service.repo.get_by_id(
         project_id=project_id, user_id=user["id"]
     )
     if not project:
@@ -86,7 +99,7 @@ def delete_project(
             detail="Project not found or you don't have access",
         )
 
-    result = service.delete_project(project=project)
+    result = await service.delete_project(project=project)
     if result.status_code != 200:
         raise HTTPException(status_code=result.status_code, detail=result.message)
     return None
@@ -1,13 +1,54 @@
-from database.session import session
+from datetime import datetime
+from sqlalchemy import func, select
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, joinedload
 from app.database.models.project import Project
 from app.database.models.scene import Scene
 from sqlalchemy.exc import SQLAlchemyError
-from app.core.exceptions import DatabaseConnectionError
+from core.exceptions import DatabaseConnectionError
+from typing import List, Tuple
+from core.pagination import keyset_before
+from database.routing import read_only
+
+PROJECT_DETAIL_COLUMNS = (
+    Project.id,
+    Project.title,
+    Project.story_text,
+    Project.duration_sec,
+    Project.status,
+    Project.created_at,
+    Project.updated_at,
+    Project.video_path,
+)
+# Everything the project list shows; story_text stays in the database
+PROJECT_SUMMARY_COLUMNS = (
+    Project.id,
+    Project.title,
+    Project.duration_sec,
+    Project.status,
+    Project.video_path,
+    Project.created_at,
+    Project.updated_at,
+)
+SCENE_DETAIL_COLUMNS = tuple(
+    column.label(f"scene_{column.key}")
+    for column in (
+        Scene.id,
+        Scene.description,
+        Scene.background_prompt,
+        Scene.background_path,
+        Scene.character_prompts,
+        Scene.character_paths,
+        Scene.start_sec,
+        Scene.duration_sec,
+    )
+)
 
 
 class ProjectRepository:
-    def __init__(self):
-        self.db = session()
+    def __init__(self, db: Session):
+        self.db = db
 
     def create(
         self, user_id: int, title: str, story_text: str, duration_sec: int = 20
@@ -29,26 +70,14 @@ class ProjectRepository:
             raise DatabaseConnectionError(detail=f"Failed to create project: {str(e)}")
 
     def get_by_id(self, project_id: int, user_id: int) -> Project | None:
-        project = (
+        # Scenes come back in the same round trip, ordered by the relationship.
+        # Always the primary: the callers go on to write scenes
+        return (
             self.db.query(Project)
+            .options(joinedload(Project.scenes))
             .filter(Project.id == project_id, Project.user_id == user_id)
             .first()
         )
-        if not project:
-            return None
-        scenes = (
-            self.db.query(Scene)
-            .filter(Scene.project_id == project_id)
-            .order_by(Scene.scene_index)
-            .all()
-        )
-
-        # Attach scenes to project
-        project.scenes = scenes
-        return project
-
-    def get_projects(self, user_id: int) -> Project | None:
-        return self.db.query(Project).filter(Project.user_id == user_id).all()
 
     def update_status(self, project: Project, status: str) -> Project:
         project.status = status
@@ -68,3 +97,142 @@ class ProjectRepository:
         except SQLAlchemyError as e:
             self.db.rollback()
             raise DatabaseConnectionError(detail=f"Failed to delete project: {str(e)}")
+
+
+class AsyncProjectRepository:
+    """ProjectRepository for async routes (AsyncSession)"""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def create(
+        self, user_id: int, title: str, story_text: str, duration_sec: int = 20
+    ) -> Project:
+        project = Project(
+            user_id=user_id,
+            title=title,
+            story_text=story_text,
+            duration_sec=duration_sec,
+            status="draft",
+        )
+        try:
+            self.db.add(project)
+            await self.db.commit()
+            await self.db.refresh(project)
+            return project
+        except SQLAlchemyError as e:
+            await self.db.rollback()
+            raise DatabaseConnectionError(detail=f"Failed to create project: {str(e)}")
+
+    async def get_by_id(self, project_id: int, user_id: int) -> Project | None:
+        """Project with its scenes from the primary, for callers that go on
+        to update or delete it"""
+        result = await self.db.execute(
+            select(Project)
+            .options(joinedload(Project.scenes))
+            .where(Project.id == project_id, Project.user_id == user_id)
+        )
+        return result.unique().scalar_one_or_none()
+
+    @read_only(fallback_on_miss=True)
+    async def view_by_id(self, project_id: int, user_id: int) -> Project | None:
+        """get_by_id for read-only responses; may be served by a replica"""
+        return await self.get_by_id(project_id, user_id)
+
+    @read_only(fallback_on_miss=True)
+    async def get_detail(self, project_id: int, user_id: int) -> dict | None:
+        """Project and scenes as plain dicts from one joined SELECT of columns.
+
+        For read-only responses: no ORM instances are built, so there is no
+        identity map or attribute instrumentation work per scene.
+        """
+        result = await self.db.execute(
+            select(*PROJECT_DETAIL_COLUMNS, *SCENE_DETAIL_COLUMNS)
+            .outerjoin(Scene, Scene.project_id == Project.id)
+            .where(Project.id == project_id, Project.user_id == user_id)
+            .order_by(Scene.scene_index)
+        )
+        rows = result.all()
+        if not rows:
+            return None
+        first = rows[0]
+        return {
+            "id": first.id,
+            "title": first.title,
+            "story_text": first.story_text,
+            "duration_sec": first.duration_sec,
+            "status": first.status,
+            "created_at": first.created_at.isoformat(),
+            "updated_at": first.updated_at.isoformat(),
+            "video_path": first.video_path,
+            "scenes": [
+                {
+                    "id": r.scene_id,
+                    "description": r.scene_description,
+                    "background_prompt": r.scene_background_prompt,
+                    "background_path": r.scene_background_path,
+                    "character_prompts": r.scene_character_prompts or [],
+                    "character_paths": r.scene_character_paths or [],
+                    "start_sec": r.scene_start_sec,
+                    "duration_sec": r.scene_duration_sec,
+                }
+                for r in rows
+                if r.scene_id is not None
+            ],
+        }
+
+    async def get_many_by_ids(
+        self, project_ids: List[int], user_id: int
+    ) -> List[Project]:
+        projects = await self.db.scalars(
+            select(Project).where(
+                Project.id.in_(project_ids), Project.user_id == user_id
+            )
+        )
+        return list(projects)
+
+    @read_only
+    async def list_summaries(
+        self,
+        user_id: int,
+        limit: int,
+        after: Tuple[datetime, int] | None = None,
+        with_scene_count: bool = False,
+    ) -> List[Row]:
+        """Newest-first page of summary rows, keyset paginated on
+        (created_at, id). Scene counts come from one GROUP BY on the join."""
+        stmt = select(*PROJECT_SUMMARY_COLUMNS).where(Project.user_id == user_id)
+        if with_scene_count:
+            stmt = (
+                stmt.add_columns(func.count(Scene.id).label("scene_count"))
+                .outerjoin(Scene, Scene.project_id == Project.id)
+                .group_by(Project.id)
+            )
+        if after:
+            stmt = stmt.where(keyset_before(Project.created_at, Project.id, after))
+        stmt = stmt.order_by(Project.created_at.desc(), Project.id.desc()).limit(limit)
+        try:
+            result = await self.db.execute(stmt)
+            return result.all()
+        except SQLAlchemyError as e:
+            await self.db.rollback()
+            raise DatabaseConnectionError(detail=f"Failed to list projects: {str(e)}")
+
+    async def update_status(self, project: Project, status: str) -> Project:
+        project.status = status
+        try:
+            self.db.add(project)
+            await self.db.commit()
+            await self.db.refresh(project)
+            return project
+        except SQLAlchemyError as e:
+            await self.db.rollback()
+            raise DatabaseConnectionError(detail=f"Failed to update status: {str(e)}")
+
+    async def delete(self, project: Project) -> None:
+        try:
+            await self.db.delete(project)
+            await self.db.commit()
+        except SQLAlchemyError as e:
+            await self.db.rollback()
+            raise DatabaseConnectionError(detail=f"Failed to delete project: {str(e)}")
@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import Optional
 from datetime import datetime
 
@@ -8,6 +8,12 @@ class ProjectCreate(BaseModel):
     duration_sec: Optional[int] = 20
 
 
+class ProjectListQuery(BaseModel):
+    cursor: Optional[str] = None
+    limit: int = Field(default=20, ge=1, le=100)
+    withSceneCount: bool = False
+
+
 class ProjectStatusUpdate(BaseModel):
     status: str 
 
@@ -1,21 +1,49 @@
 # backend/app/modules/project/service.py
-from modules.project.repository import ProjectRepository
+from modules.project.repository import AsyncProjectRepository
 from core.response import ApiResponse
+from core.pagination import decode_cursor, encode_cursor
 from core.exceptions import HTTPException
 from app.database.models.project import Project
 from typing import Any
+from sqlalchemy.ext.asyncio import AsyncSession
 from modules.project.schemas import ProjectResponse
 
 
+def _project_detail(project: Project) -> dict:
+    return {
+        "id": project.id,
+        "title": project.title,
+        "story_text": project.story_text,
+        "duration_sec": project.duration_sec,
+        "status": project.status,
+        "created_at": project.created_at.isoformat(),
+        "updated_at": project.updated_at.isoformat(),
+        "video_path": project.video_path,
+        "scenes": [
+            {
+                "id": s.id,
+                "description": s.description,
+                "background_prompt": s.background_prompt,
+                "background_path": s.background_path,
+                "character_prompts": s.character_prompts or [],
+                "character_paths": s.character_paths or [],
+                "start_sec": s.start_sec,
+                "duration_sec": s.duration_sec,
+            }
+            for s in project.scenes
+        ],
+    }
+
+
 class ProjectService:
-    def __init__(self):
-        self.repo = ProjectRepository()
+    def __init__(self, db: AsyncSession):
+        self.repo = AsyncProjectRepository(db)
 
-    def create_project(
+    async def create_project(
         self, user_id: int, title: str, story_text: str, duration_sec: int = 20
     ) -> ApiResponse:
         try:
-            project: Project = self.repo.create(
+            project: Project = await self.repo.create(
                 user_id=user_id,
                 title=title,
                 story_text=story_text,
@@ -41,53 +69,70 @@ class ProjectService:
         except Exception as e:
             return ApiResponse.error(message=str(e), status_code=500)
 
-    def get_projects(self, user_id: int) -> ApiResponse:
+    async def get_projects(
+        self,
+        user_id: int,
+        limit: int = 20,
+        cursor: str | None = None,
+        with_scene_count: bool = False,
+    ) -> ApiResponse:
         try:
-            projects = self.repo.get_projects(user_id)
+            after = decode_cursor(cursor) if cursor else None
+        except ValueError as e:
+            return ApiResponse.error(message=str(e), status_code=400)
+        try:
+            # One extra row tells whether another page exists
+            rows = await self.repo.list_summaries(
+                user_id, limit + 1, after=after, with_scene_count=with_scene_count
+            )
+            page = rows[:limit]
+            items = []
+            for row in page:
+                item = {
+                    "id": row.id,
+                    "title": row.title,
+                    "duration_sec": row.duration_sec,
+                    "status": row.status,
+                    "video_path": row.video_path,
+                    "created_at": row.created_at.isoformat(),
+                    "updated_at": row.updated_at.isoformat(),
+                }
+                if with_scene_count:
+                    item["scene_count"] = row.scene_count
+                items.append(item)
+            next_cursor = (
+                encode_cursor(page[-1].created_at, page[-1].id)
+                if len(rows) > limit
+                else None
+            )
             return ApiResponse(
                 message="Project retrieved successfully",
                 status_code=200,
-                data=[p.__dict__ for p in projects],
+                data={"items": items, "next_cursor": next_cursor, "limit": limit},
             )
         except Exception as e:
             return ApiResponse.error(message=str(e), status_code=500)
 
-    def get_project(self, project_id: int, user_id: int) -> ApiResponse:
+    async def get_project(
+        self, project_id: int, user_id: int, projection: bool = True
+    ) -> ApiResponse:
+        """Project with its scenes; ``projection`` reads plain columns instead
+        of loading ORM objects, which is all a read-only response needs."""
         try:
-            project: Project | None = self.repo.get_by_id(
-                project_id=project_id, user_id=user_id
-            )
-            if not project:
+            if projection:
+                project_format = await self.repo.get_detail(
+                    project_id=project_id, user_id=user_id
+                )
+            else:
+                project: Project | None = await self.repo.view_by_id(
+                    project_id=project_id, user_id=user_id
+                )
+                project_format = _project_detail(project) if project else None
+            if not project_format:
                 return ApiResponse.error(
                     message="Project not found or access denied", status_code=404
                 )
 
-            project_format = {
-                "id": project.id,
-                "title": project.title,
-                "story_text": project.story_text,
-                "duration_sec": project.duration_sec,
-                "status": project.status,
-                "created_at": project.created_at.isoformat(),
-                "updated_at": project.updated_at.isoformat(),
-                "video_path": project.video_path,
-                "scenes": (
-                    [
-                        {
-                            "id": s.id,
-                            "description": s.description,
-                            "background_prompt": s.background_prompt,
-                            "background_path": s.background_path,
-                            "character_prompts": s.character_prompts or [],
-                            "character_paths": s.character_paths or [],
-                        }
-                        for s in project.scenes
-                    ]
-                    if project.scenes
-                    else []
-                ),
-            }
-
             return ApiResponse(
                 message="Project retrieved successfully",
                 status_code=200,
@@ -96,9 +141,9 @@ class ProjectService:
         except Exception as e:
             return ApiResponse.error(message=str(e), status_code=500)
 
-    def update_project_status(self, project: Project, new_status: str) -> ApiResponse:
+    async def update_project_status(self, project: Project, new_status: str) -> ApiResponse:
         try:
-            updated_project: Project = self.repo.update_status(
+            updated_project: Project = await self.repo.update_status(
                 project=project, status=new_status
             )
             return ApiResponse(
@@ -109,9 +154,9 @@ class ProjectService:
         except Exception as e:
             return ApiResponse.error(message=str(e), status_code=500)
 
-    def delete_project(self, project: Project) -> ApiResponse:
+    async def delete_project(self, project: Project) -> ApiResponse:
         try:
-            self.repo.delete(project)
+            await self.repo.delete(project)
             return ApiResponse(
                 message="Project deleted successfully", status_code=200, data=None
             )
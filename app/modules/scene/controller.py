@@ -1,12 +1,121 @@
-from fastapi import APIRouter, Depends
-from modules.scene.service import SceneService
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from database.session import get_async_db, get_db
+from modules.scene.service import AsyncSceneService, SceneService
 from core.middleware import is_authenticated
-from modules.scene.schemas import SceneRequest
+from modules.scene.schemas import (
+    SceneRequest,
+    SceneBatchRequest,
+    ScenePreviewRequest,
+    SceneStyleQuery,
+)
+from modules.story.styles import available_styles
 
 router = APIRouter(prefix="/projects", tags=["Scenes"])
-scene_service = SceneService()
 
 
-@router.post("/segment")
-def segment_story(request: SceneRequest, user: dict = Depends(is_authenticated)):
-    return scene_service.segment_story(request.projectId, user["id"])
+def get_scene_service(db: Session = Depends(get_db)):
+    return SceneService(db)
+
+
+def get_async_scene_service(db: AsyncSession = Depends(get_async_db)):
+    return AsyncSceneService(db)
+
+
+@router.get("/segment/styles")
+def list_styles():
+    return {"styles": available_styles()}
+
+
+@router.post("/segment/preview")
+def preview_segmentation(
+    request: ScenePreviewRequest,
+    user: dict = Depends(is_authenticated),
+    scene_service: SceneService = Depends(get_scene_service),
+):
+    result = scene_service.preview_segmentation(
+        request.storyText,
+        style=request.style,
+        mode=request.mode,
+        max_scenes=request.maxScenes,
+        target_duration=request.targetDuration,
+    )
+    if result.status_code != 200:
+        raise HTTPException(status_code=result.status_code, detail=result.message)
+    return result
+
+
+@router.post("/segment", status_code=status.HTTP_202_ACCEPTED)
+def segment_story(
+    request: SceneRequest,
+    user: dict = Depends(is_authenticated),
+    scene_service: SceneService = Depends(get_scene_service),
+):
+    result = scene_service.enqueue_segmentation(
+        request.projectId, user["id"], style=request.style
+    )
+    if result.status_code != 202:
+        raise HTTPException(status_code=result.status_code, detail=result.message)
+    return result
+
+
+@router.get("/{project_id}/segment-status")
+def segment_status(
+    project_id: int,
+    user: dict = Depends(is_authenticated),
+    scene_service: SceneService = Depends(get_scene_service),
+):
+    result = scene_service.segmentation_status(project_id, user["id"])
+    if result.status_code != 200:
+        raise HTTPException(status_code=result.status_code, detail=result.message)
+    return result
+
+
+@router.post("/segment/batch")
+async def segment_stories(
+    request: SceneBatchRequest,
+    user: dict = Depends(is_authenticated),
+    scene_service: AsyncSceneService = Depends(get_async_scene_service),
+):
+    return await scene_service.segment_stories(
+        request.projectIds,
+        user["id"],
+        batch_size=request.batchSize,
+        style=request.style,
+    )
+
+
+@router.post("/{project_id}/resegment")
+def resegment_story(
+    project_id: int,
+    query: SceneStyleQuery = Depends(),
+    user: dict = Depends(is_authenticated),
+    scene_service: SceneService = Depends(get_scene_service),
+):
+    result = scene_service.resegment_story(project_id, user["id"], style=query.style)
+    if result.status_code != 200:
+        raise HTTPException(status_code=result.status_code, detail=result.message)
+    return result
+
+
+@router.get("/{project_id}/segment/stream")
+def stream_segment_story(
+    project_id: int,
+    query: SceneStyleQuery = Depends(),
+    user: dict = Depends(is_authenticated),
+    scene_service: SceneService = Depends(get_scene_service),
+):
+    project = scene_service.project_repo.get_by_id(project_id, user["id"])
+    if not project:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Project not found or you don't have access",
+        )
+    # The request session stays open until the stream has been sent
+    return StreamingResponse(
+        scene_service.stream_segmentation(project, style=query.style),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
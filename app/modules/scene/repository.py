@@ -1,36 +1,210 @@
-from database.session import session
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.engine import Row
+from sqlalchemy.sql.dml import Delete
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
-from app.core.exceptions import DatabaseConnectionError
+from core.exceptions import DatabaseConnectionError
 from app.database.models.scene import Scene
 from app.database.models.project import Project
-from sqlalchemy.exc import SQLAlchemyError
-from typing import List
+from typing import Dict, List, Tuple
+from modules.story.cache import sentence_fingerprint
+
+
+SCENE_COLUMNS = tuple(Scene.__table__.c)
+
+
+def scene_row(scene: dict, project_id: int) -> dict:
+    """Column values of a processor scene, ready for a bulk INSERT"""
+    return {
+        "project_id": project_id,
+        "scene_index": scene["scene_index"],
+        "description": scene["description"],
+        "fingerprint": scene.get("fingerprint")
+        or sentence_fingerprint(scene["description"]),
+        "background_prompt": scene.get("background_prompt"),
+        "character_prompts": scene["character_prompts"],
+        "start_sec": scene.get("start_sec"),
+        "duration_sec": scene.get("duration_sec"),
+    }
+
+
+def _can_return_many(dialect) -> bool:
+    # INSERT .. RETURNING over many rows: SQLite, PostgreSQL, MariaDB; not MySQL
+    return bool(getattr(dialect, "insert_executemany_returning", False))
+
+
+def _inserted_rows_query(project_ids):
+    """Fallback SELECT for dialects without RETURNING. The projects' scenes
+    were replaced in the same transaction, so they are exactly the new rows."""
+    return (
+        select(*SCENE_COLUMNS)
+        .where(Scene.project_id.in_(list(project_ids)))
+        .order_by(Scene.project_id, Scene.scene_index)
+    )
+
+
+def _replace_scenes(project_ids) -> Delete:
+    # Segmenting starts from scratch; old rows would collide on the unique
+    # (project_id, scene_index) key
+    return delete(Scene).where(Scene.project_id.in_(list(project_ids)))
+
+
+def _in_key_order(result) -> List[Row]:
+    return sorted(result, key=lambda r: (r.project_id, r.scene_index))
+
+
+def _group_by_project(rows: List[Row], project_ids) -> Dict[int, List[Row]]:
+    grouped = {project_id: [] for project_id in project_ids}
+    for row in rows:
+        grouped[row.project_id].append(row)
+    return grouped
 
 
 class SceneRepository:
-    def __init__(self):
-        self.db = session()
-
-    def create_many(self, scenes: List[dict], project_id: int):
-        db_project = self.db.query(Project).filter(Project.id == project_id).first()
-        db_scenes = [
-            Scene(
-                project_id=project_id,
-                scene_index=s["scene_index"],
-                description=s["description"],
-                background_prompt=s.get("background_prompt"),
-                character_prompts=s["character_prompts"],
-            )
+    def __init__(self, db: Session):
+        self.db = db
+
+    def create_many(self, scenes: List[dict], project_id: int) -> List[Row]:
+        """Replace the project's scenes and mark it as segmented.
+
+        One DELETE, one multi-row INSERT (RETURNING the new rows where the dialect can,
+        otherwise one SELECT afterwards) and one UPDATE, whatever the number
+        of scenes. Rows are returned instead of ORM objects, so nothing is
+        expired by the commit and no per-row refresh is needed.
+        """
+        return self.create_many_for_projects({project_id: scenes})[project_id]
+
+    def create_many_for_projects(
+        self, scenes_by_project: Dict[int, List[dict]]
+    ) -> Dict[int, List[Row]]:
+        """Replace the scenes of several projects in a single transaction"""
+        rows = [
+            scene_row(s, project_id)
+            for project_id, scenes in scenes_by_project.items()
             for s in scenes
         ]
         try:
-            self.db.add_all(db_scenes)
-            db_project.status = "segmented"
+            self.db.execute(_replace_scenes(scenes_by_project))
+            inserted = self._insert_rows(rows, scenes_by_project) if rows else []
+            self.db.execute(
+                update(Project)
+                .where(Project.id.in_(list(scenes_by_project)))
+                .values(status="segmented")
+                .execution_options(synchronize_session=False)
+            )
+            self.db.commit()
+            return _group_by_project(inserted, scenes_by_project)
+        except SQLAlchemyError as e:
+            self.db.rollback()
+            raise DatabaseConnectionError(detail=f"Failed to save scenes: {str(e)}")
+
+    def _insert_rows(self, rows: List[dict], project_ids) -> List[Row]:
+        table = Scene.__table__
+        if _can_return_many(self.db.get_bind().dialect):
+            result = self.db.execute(insert(table).returning(*SCENE_COLUMNS), rows)
+            return _in_key_order(result)
+        self.db.execute(insert(table), rows)
+        return _in_key_order(self.db.execute(_inserted_rows_query(project_ids)))
+
+    def apply_resegmentation(
+        self,
+        project_id: int,
+        removed: List[Scene],
+        kept: List[Tuple[Scene, dict]],
+        added: List[dict],
+    ) -> List[Scene]:
+        """Apply a scene diff in one transaction.
+
+        ``kept`` pairs an existing scene with its new index, timeline and
+        prompts, so its generated assets survive; ``removed`` scenes are
+        deleted and ``added`` ones inserted.
+        """
+        try:
+            if removed:
+                (
+                    self.db.query(Scene)
+                    .filter(Scene.id.in_([s.id for s in removed]))
+                    .delete(synchronize_session=False)
+                )
+            # Park moved scenes on negative indexes first so no two rows ever
+            # share a (project_id, scene_index) while reindexing
+            moved = [(s, d) for s, d in kept if s.scene_index != d["scene_index"]]
+            for db_scene, _ in moved:
+                db_scene.scene_index = -1 - db_scene.id
+            self.db.flush()
+
+            for db_scene, scene in kept:
+                db_scene.scene_index = scene["scene_index"]
+                db_scene.start_sec = scene["start_sec"]
+                db_scene.duration_sec = scene["duration_sec"]
+                db_scene.background_prompt = scene["background_prompt"]
+                db_scene.character_prompts = scene["character_prompts"]
+
+            db_added = [
+                Scene(
+                    project_id=project_id,
+                    scene_index=s["scene_index"],
+                    description=s["description"],
+                    fingerprint=s["fingerprint"],
+                    background_prompt=s.get("background_prompt"),
+                    character_prompts=s["character_prompts"],
+                    start_sec=s.get("start_sec"),
+                    duration_sec=s.get("duration_sec"),
+                )
+                for s in added
+            ]
+            self.db.add_all(db_added)
+            (
+                self.db.query(Project)
+                .filter(Project.id == project_id)
+                .update({Project.status: "segmented"}, synchronize_session=False)
+            )
             self.db.commit()
-            self.db.refresh(db_project)
-            for s in db_scenes:
-                self.db.refresh(s)
-            return db_scenes
+            return sorted(
+                [s for s, _ in kept] + db_added, key=lambda s: s.scene_index
+            )
         except SQLAlchemyError as e:
             self.db.rollback()
+            raise DatabaseConnectionError(detail=f"Failed to update scenes: {str(e)}")
+
+
+class AsyncSceneRepository:
+    """SceneRepository for async routes (AsyncSession)"""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def create_many_for_projects(
+        self, scenes_by_project: Dict[int, List[dict]]
+    ) -> Dict[int, List[Row]]:
+        """Replace the scenes of several projects in a single transaction"""
+        rows = [
+            scene_row(s, project_id)
+            for project_id, scenes in scenes_by_project.items()
+            for s in scenes
+        ]
+        try:
+            await self.db.execute(_replace_scenes(scenes_by_project))
+            inserted = await self._insert_rows(rows, scenes_by_project) if rows else []
+            await self.db.execute(
+                update(Project)
+                .where(Project.id.in_(list(scenes_by_project)))
+                .values(status="segmented")
+                .execution_options(synchronize_session=False)
+            )
+            await self.db.commit()
+            return _group_by_project(inserted, scenes_by_project)
+        except SQLAlchemyError as e:
+            await self.db.rollback()
             raise DatabaseConnectionError(detail=f"Failed to save scenes: {str(e)}")
+
+    async def _insert_rows(self, rows: List[dict], project_ids) -> List[Row]:
+        table = Scene.__table__
+        if _can_return_many(self.db.bind.dialect):
+            result = await self.db.execute(insert(table).returning(*SCENE_COLUMNS), rows)
+            return _in_key_order(result)
+        await self.db.execute(insert(table), rows)
+        return _in_key_order(
+            await self.db.execute(_inserted_rows_query(project_ids))
+        )
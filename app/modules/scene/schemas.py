@@ -1,10 +1,36 @@
 # modules/scene/schemas.py
-from pydantic import BaseModel
-from typing import Optional, List
+from pydantic import AfterValidator, BaseModel, Field
+from typing import Annotated, Literal, Optional, List
 from datetime import datetime
+from modules.story.styles import DEFAULT_STYLE, available_styles
+
+
+def validate_style(style: str) -> str:
+    if style not in available_styles():
+        raise ValueError(f"must be one of: {', '.join(available_styles())}")
+    return style
+
+
+StyleName = Annotated[str, AfterValidator(validate_style)]
 
 class SceneRequest(BaseModel):
     projectId: int
+    style: StyleName = DEFAULT_STYLE
+
+class SceneBatchRequest(BaseModel):
+    projectIds: List[int] = Field(min_length=1, max_length=1000)
+    batchSize: int = Field(default=32, ge=1, le=512)
+    style: StyleName = DEFAULT_STYLE
+
+class SceneStyleQuery(BaseModel):
+    style: StyleName = DEFAULT_STYLE
+
+class ScenePreviewRequest(BaseModel):
+    storyText: str = Field(min_length=1, max_length=100_000)
+    style: StyleName = DEFAULT_STYLE
+    mode: Literal["fast", "full"] = "fast"
+    maxScenes: int = Field(default=5, ge=1, le=50)
+    targetDuration: int = Field(default=25, ge=1, le=600)
 
 class SceneCreate(BaseModel):
     scene_index: int
@@ -15,5 +41,7 @@ class SceneResponse(BaseModel):
     id: int
     description: str
     background_prompt: str | None
+    start_sec: float | None = None
+    duration_sec: float | None = None
 
     model_config = {"from_attributes": True}
\ No newline at end of file
@@ -1,25 +1,103 @@
-from modules.project.repository import ProjectRepository
-from modules.scene.repository import SceneRepository
-from modules.story.processor import AnimeStyle, StoryProcessing
-from core.response import ApiResponse
+from modules.project.repository import AsyncProjectRepository, ProjectRepository
+from modules.scene.repository import AsyncSceneRepository, SceneRepository
+from modules.story.processor import StoryProcessing, process_stories
+from modules.story.styles import DEFAULT_STYLE, restyle_prompts
+from modules.story.executor import nlp_executor
+from modules.story.cache import segmentation_cache, sentence_fingerprint
+from core.response import ApiResponse, sse_event
+from core.logger import logger
 from modules.scene.schemas import SceneResponse
+from app.database.models.project import Project
+from collections import defaultdict, deque
+from typing import Callable, Iterator, List, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from celery.result import AsyncResult
+from celery_worker import celery_app
+from database.redis import redis_client
+from tasks.segmentation_tasks import segment_project
+
+SEGMENT_JOB_KEY = "segment-job:"
+SEGMENT_JOB_TTL = 24 * 3600
+
+
+def _plan_batch(projects: List[Project], style: str):
+    """Split a chunk into cached results and stories that still need NLP"""
+    scenes_by_project, jobs, cache_keys = {}, [], {}
+    for p in projects:
+        options = {
+            "target_duration": p.duration_sec,
+            "max_scenes": 5,
+            "anime_style": style,
+        }
+        cache_keys[p.id] = StoryProcessing(**options).cache_key(p.story_text)
+        # Only stories we have not segmented before go through spaCy
+        cached = segmentation_cache.get(cache_keys[p.id])
+        if cached is not None:
+            scenes_by_project[p.id] = cached
+        else:
+            jobs.append((p.id, p.story_text, options))
+    return scenes_by_project, jobs, cache_keys
+
+
+def _cache_results(scenes_by_project: dict, results: dict, cache_keys: dict) -> dict:
+    for project_id, scenes in results.items():
+        segmentation_cache.set(cache_keys[project_id], scenes)
+    return {**scenes_by_project, **results}
+
+
+def _serialize_batch(db_scenes: dict) -> dict:
+    return {
+        project_id: [SceneResponse.model_validate(s).model_dump() for s in scenes]
+        for project_id, scenes in db_scenes.items()
+    }
+
+
+def _batch_response(project_ids: List[int], segmented: dict) -> ApiResponse:
+    return ApiResponse(
+        message=f"{len(segmented)} stories segmented into scenes",
+        status_code=200,
+        data={
+            "projects": segmented,
+            "not_found": [pid for pid in project_ids if pid not in segmented],
+        },
+    )
+
 
 class SceneService:
-    def __init__(self):
-        self.project_repo = ProjectRepository()
-        self.scene_repo = SceneRepository()
+    def __init__(self, db: Session):
+        self.project_repo = ProjectRepository(db)
+        self.scene_repo = SceneRepository(db)
 
-    def segment_story(self, project_id: int, user_id: int) -> ApiResponse:
+    def segment_story(
+        self,
+        project_id: int,
+        user_id: int,
+        on_progress: Optional[Callable[[int, int], None]] = None,
+        style: str = DEFAULT_STYLE,
+    ) -> ApiResponse:
         try:
             project = self.project_repo.get_by_id(project_id, user_id)
+            if not project:
+                return ApiResponse.error(
+                    message="Project not found or access denied", status_code=404
+                )
 
             processor = StoryProcessing(
                 target_duration=project.duration_sec,
                 max_scenes=5,
-                anime_style=AnimeStyle.SHONEN,
+                anime_style=style,
             )
 
-            scenes_data = processor.process_story(project.story_text)
+            scenes_done = []
+
+            def report_scene(scene: dict):
+                scenes_done.append(scene)
+                on_progress(len(scenes_done), processor.max_scenes)
+
+            scenes_data = processor.process_story(
+                project.story_text, on_scene=report_scene if on_progress else None
+            )
             db_scenes = self.scene_repo.create_many(scenes_data, project.id)
             response_data = [
                 SceneResponse.model_validate(s).model_dump() for s in db_scenes
@@ -32,3 +110,256 @@ class SceneService:
             )
         except Exception as e:
             return ApiResponse.error(message=str(e), status_code=500)
+
+    def enqueue_segmentation(
+        self, project_id: int, user_id: int, style: str = DEFAULT_STYLE
+    ) -> ApiResponse:
+        """Queue segmentation on the CPU worker and hand back the job id"""
+        project = self.project_repo.get_by_id(project_id, user_id)
+        if not project:
+            return ApiResponse.error(
+                message="Project not found or access denied", status_code=404
+            )
+
+        job = segment_project.delay(project_id, user_id, style)
+        redis_client.setex(f"{SEGMENT_JOB_KEY}{project_id}", SEGMENT_JOB_TTL, job.id)
+        return ApiResponse(
+            message="Story segmentation queued",
+            status_code=202,
+            data={"job_id": job.id, "project_id": project_id},
+        )
+
+    def segmentation_status(self, project_id: int, user_id: int) -> ApiResponse:
+        project = self.project_repo.get_by_id(project_id, user_id)
+        if not project:
+            return ApiResponse.error(
+                message="Project not found or access denied", status_code=404
+            )
+
+        job_id = redis_client.get(f"{SEGMENT_JOB_KEY}{project_id}")
+        if not job_id:
+            return ApiResponse.error(
+                message="No segmentation job for this project", status_code=404
+            )
+
+        job = AsyncResult(job_id, app=celery_app)
+        data = {"job_id": job_id, "project_id": project_id, "state": job.state}
+        if job.state == "PROGRESS":
+            data["progress"] = job.info
+        elif job.state == "SUCCESS":
+            data["result"] = (job.result or {}).get("data")
+        elif job.state == "FAILURE":
+            data["error"] = str(job.result)
+        return ApiResponse(
+            message=f"Segmentation job is {job.state.lower()}",
+            status_code=200,
+            data=data,
+        )
+
+    def resegment_story(
+        self, project_id: int, user_id: int, style: str = DEFAULT_STYLE
+    ) -> ApiResponse:
+        """Re-segment after an edit, reprocessing only the changed sentences.
+
+        Existing scenes are matched to the new sentences by fingerprint, so
+        unchanged scenes keep their id and generated background/character
+        assets; only new sentences go through NER and prompt generation.
+        Kept scenes get their prompts rewritten in ``style``; one whose
+        prompts match no known style is reprocessed like a new sentence.
+        """
+        try:
+            project = self.project_repo.get_by_id(project_id, user_id)
+            if not project:
+                return ApiResponse.error(
+                    message="Project not found or access denied", status_code=404
+                )
+
+            processor = StoryProcessing(
+                target_duration=project.duration_sec,
+                max_scenes=5,
+                anime_style=style,
+            )
+            sentences = processor.split_sentences(project.story_text)
+
+            existing = defaultdict(deque)
+            for scene in sorted(project.scenes or [], key=lambda s: s.scene_index):
+                fingerprint = scene.fingerprint or sentence_fingerprint(scene.description)
+                existing[fingerprint].append(scene)
+
+            timeline, kept, changed, removed = [], [], [], []
+            for index, text in enumerate(sentences):
+                matches = existing.get(sentence_fingerprint(text))
+                scene = matches.popleft() if matches else None
+                prompts = scene and restyle_prompts(
+                    scene.background_prompt, scene.character_prompts or [], processor.style
+                )
+                if prompts:
+                    kept.append((scene, index, prompts))
+                else:
+                    if scene:
+                        removed.append(scene)
+                    changed.append((index, text))
+                timeline.append({"scene_index": index, "description": text})
+
+            added = processor.scenes_for_sentences(changed)
+            processor.adjust_duration(timeline)
+            removed += [scene for scenes in existing.values() for scene in scenes]
+
+            db_scenes = self.scene_repo.apply_resegmentation(
+                project.id,
+                removed=removed,
+                kept=[
+                    (
+                        scene,
+                        {
+                            **timeline[index],
+                            "background_prompt": background_prompt,
+                            "character_prompts": character_prompts,
+                        },
+                    )
+                    for scene, index, (background_prompt, character_prompts) in kept
+                ],
+                added=[{**scene, **timeline[scene["scene_index"]]} for scene in added],
+            )
+            return ApiResponse(
+                message="Story re-segmented",
+                status_code=200,
+                data={
+                    "kept": len(kept),
+                    "added": len(added),
+                    "removed": len(removed),
+                    "scenes": [
+                        SceneResponse.model_validate(s).model_dump() for s in db_scenes
+                    ],
+                },
+            )
+        except Exception as e:
+            return ApiResponse.error(message=str(e), status_code=500)
+
+    def preview_segmentation(
+        self,
+        story_text: str,
+        style: str = DEFAULT_STYLE,
+        mode: str = "fast",
+        max_scenes: int = 5,
+        target_duration: int = 25,
+    ) -> ApiResponse:
+        """Segment raw text without touching the database.
+
+        Meant for the editor, which calls it on every pause in typing: the
+        default fast mode skips the trained pipeline entirely, and results
+        are not cached since each draft is only ever seen once.
+        """
+        try:
+            processor = StoryProcessing(
+                target_duration=target_duration,
+                max_scenes=max_scenes,
+                anime_style=style,
+                mode=mode,
+            )
+            scenes = processor.process_story(story_text, use_cache=False)
+            return ApiResponse(
+                message="Story preview", status_code=200, data=scenes
+            )
+        except Exception as e:
+            return ApiResponse.error(message=str(e), status_code=500)
+
+    def stream_segmentation(
+        self, project: Project, style: str = DEFAULT_STYLE
+    ) -> Iterator[str]:
+        """Segment a story as Server-Sent Events.
+
+        Each scene is sent as soon as its sentence is done. Nothing is
+        written until the whole story is: the scenes then replace the old
+        set in one transaction, so a failure or a client that disconnects
+        mid-stream leaves the previous scenes in place. The final ``done``
+        event carries the saved ids and the timeline, which needs every scene.
+        """
+        processor = StoryProcessing(
+            target_duration=project.duration_sec,
+            max_scenes=5,
+            anime_style=style,
+        )
+        key = processor.cache_key(project.story_text)
+        cached = segmentation_cache.get(key)
+        scenes = cached if cached is not None else processor.iter_scenes(project.story_text)
+
+        raw_scenes = []
+        try:
+            for scene in scenes:
+                raw_scenes.append(scene)
+                yield sse_event(
+                    "scene",
+                    {
+                        "scene_index": scene["scene_index"],
+                        "description": scene["description"],
+                        "background_prompt": scene.get("background_prompt"),
+                    },
+                )
+
+            processor.adjust_duration(raw_scenes)
+            db_scenes = self.scene_repo.create_many(raw_scenes, project.id)
+            if cached is None:
+                segmentation_cache.set(key, raw_scenes)
+
+            yield sse_event(
+                "done",
+                {
+                    "message": "Story segmented into scenes",
+                    "timeline": [
+                        {
+                            "id": s.id,
+                            "scene_index": s.scene_index,
+                            "start_sec": s.start_sec,
+                            "duration_sec": s.duration_sec,
+                        }
+                        for s in db_scenes
+                    ],
+                },
+            )
+        except Exception as e:
+            logger.error(f"❌ Streaming segmentation failed: {str(e)}", exc_info=True)
+            yield sse_event("error", {"message": str(e)})
+
+
+class AsyncSceneService:
+    """Scene operations for async routes.
+
+    NLP runs in the process pool and the database calls on the async engine,
+    so neither spaCy nor a slow query ever holds up the event loop.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.project_repo = AsyncProjectRepository(db)
+        self.scene_repo = AsyncSceneRepository(db)
+
+    async def segment_stories(
+        self,
+        project_ids: List[int],
+        user_id: int,
+        batch_size: int = 32,
+        style: str = DEFAULT_STYLE,
+    ) -> ApiResponse:
+        try:
+            project_ids = list(dict.fromkeys(project_ids))
+            segmented = {}
+            for start in range(0, len(project_ids), batch_size):
+                chunk = project_ids[start : start + batch_size]
+                projects = await self.project_repo.get_many_by_ids(chunk, user_id)
+                scenes_by_project, jobs, cache_keys = _plan_batch(projects, style)
+                results = (
+                    await nlp_executor.run(process_stories, jobs, batch_size)
+                    if jobs
+                    else {}
+                )
+                scenes_by_project = _cache_results(
+                    scenes_by_project, results, cache_keys
+                )
+                if scenes_by_project:
+                    db_scenes = await self.scene_repo.create_many_for_projects(
+                        scenes_by_project
+                    )
+                    segmented.update(_serialize_batch(db_scenes))
+            return _batch_response(project_ids, segmented)
+        except Exception as e:
+            return ApiResponse.error(message=str(e), status_code=500)
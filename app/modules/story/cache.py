@@ -0,0 +1,131 @@
+# modules/story/cache.py
+import os
+import json
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional
+from redis.exceptions import RedisError
+from core.logger import logger
+from database.redis import redis_client
+
+
+def normalize_story(story_text: str) -> str:
+    """Ignore differences that never change segmentation (CRLF, edge spaces)"""
+    return "\n".join(line.strip() for line in story_text.strip().splitlines())
+
+
+def sentence_fingerprint(sentence: str) -> str:
+    """Stable id of a sentence's content, used to match scenes across edits"""
+    normalized = " ".join(sentence.split())
+    return hashlib.sha1(normalized.encode("utf-8")).hexdigest()
+
+
+class SegmentationCache:
+    """Content-addressed cache of processor output.
+
+    Tier 1 is an in-process LRU bounded by ``max_entries``; tier 2 is the
+    shared Redis instance (optional). Both tiers expire entries after ``ttl``
+    seconds. Values are stored as JSON so every hit hands out a fresh copy.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl: int = 86400,
+        use_redis: bool = False,
+        prefix: str = "segment-cache:",
+    ):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.use_redis = use_redis
+        self.prefix = prefix
+        self._entries: "OrderedDict[str, tuple[float, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.redis_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(story_text: str, **params) -> str:
+        payload = json.dumps(
+            [normalize_story(story_text), sorted(params.items())], default=str
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[List[Dict]]:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > now:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return json.loads(value)
+                del self._entries[key]
+
+        value = self._redis_get(key)
+        if value is not None:
+            self._store_local(key, value)
+            with self._lock:
+                self.redis_hits += 1
+            return json.loads(value)
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def set(self, key: str, scenes: List[Dict]) -> None:
+        value = json.dumps(scenes)
+        self._store_local(key, value)
+        if self.use_redis:
+            try:
+                redis_client.setex(f"{self.prefix}{key}", self.ttl, value)
+            except RedisError as e:
+                logger.warning(f"Segmentation cache write to Redis failed: {e}")
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.redis_hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "redis_hits": self.redis_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_ratio": (
+                    round((self.hits + self.redis_hits) / lookups, 3) if lookups else 0.0
+                ),
+            }
+
+    def _store_local(self, key: str, value: str) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def _redis_get(self, key: str) -> Optional[str]:
+        if not self.use_redis:
+            return None
+        try:
+            return redis_client.get(f"{self.prefix}{key}")
+        except RedisError as e:
+            logger.warning(f"Segmentation cache read from Redis failed: {e}")
+            return None
+
+
+segmentation_cache = SegmentationCache(
+    max_entries=int(os.getenv("SEGMENT_CACHE_SIZE", "1024")),
+    ttl=int(os.getenv("SEGMENT_CACHE_TTL", "86400")),
+    use_redis=os.getenv("SEGMENT_CACHE_REDIS", "false").lower() == "true",
+)
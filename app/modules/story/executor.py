@@ -0,0 +1,117 @@
+# modules/story/executor.py
+import os
+import time
+import asyncio
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable
+from core.logger import logger
+from modules.story.model_registry import warm_up
+
+NLP_POOL_SIZE = int(os.getenv("NLP_POOL_SIZE", str(max(1, (os.cpu_count() or 2) - 1))))
+# fork is unsafe once uvicorn/anyio threads exist
+NLP_POOL_START_METHOD = os.getenv("NLP_POOL_START_METHOD", "spawn")
+
+
+def _init_worker():
+    warm_up()
+
+
+def _noop() -> float:
+    return time.time()
+
+
+def _timed_call(fn: Callable, *args) -> tuple[float, float, Any]:
+    started = time.time()
+    result = fn(*args)
+    return started, time.time(), result
+
+
+class NlpExecutor:
+    """Process pool for CPU-bound NLP work, awaited from async routes.
+
+    Children load (and warm) the spaCy model once in their initializer, so
+    segmentation runs on every core instead of queueing behind the GIL and
+    the Starlette threadpool. Queue depth and wait/run times are tracked.
+    """
+
+    def __init__(self, max_workers: int = NLP_POOL_SIZE):
+        self.max_workers = max_workers
+        self._pool: ProcessPoolExecutor | None = None
+        self._lock = threading.Lock()
+        self.pending = 0
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.total_run = 0.0
+
+    @property
+    def pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            with self._lock:
+                if self._pool is None:
+                    self._pool = ProcessPoolExecutor(
+                        max_workers=self.max_workers,
+                        mp_context=multiprocessing.get_context(NLP_POOL_START_METHOD),
+                        initializer=_init_worker,
+                    )
+                    logger.info(f"🧠 NLP process pool started ({self.max_workers} workers)")
+        return self._pool
+
+    async def run(self, fn: Callable, *args) -> Any:
+        loop = asyncio.get_running_loop()
+        submitted_at = time.time()
+        with self._lock:
+            self.pending += 1
+            self.submitted += 1
+        try:
+            started, finished, result = await loop.run_in_executor(
+                self.pool, _timed_call, fn, *args
+            )
+        except Exception:
+            with self._lock:
+                self.failed += 1
+            raise
+        finally:
+            with self._lock:
+                self.pending -= 1
+
+        wait = max(started - submitted_at, 0.0)
+        with self._lock:
+            self.completed += 1
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+            self.total_run += finished - started
+        return result
+
+    def warm(self) -> None:
+        """Start every worker now instead of on the first requests"""
+        futures = [self.pool.submit(_noop) for _ in range(self.max_workers)]
+        for future in futures:
+            future.result()
+
+    def stats(self) -> dict:
+        with self._lock:
+            done = self.completed or 1
+            return {
+                "workers": self.max_workers,
+                "started": self._pool is not None,
+                "queue_depth": self.pending,
+                "submitted": self.submitted,
+                "completed": self.completed,
+                "failed": self.failed,
+                "avg_wait_ms": round(self.total_wait / done * 1000, 2),
+                "max_wait_ms": round(self.max_wait * 1000, 2),
+                "avg_run_ms": round(self.total_run / done * 1000, 2),
+            }
+
+    def shutdown(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+
+nlp_executor = NlpExecutor()
@@ -0,0 +1,100 @@
+# modules/story/lexicon.py
+import os
+import json
+import hashlib
+import threading
+from typing import Dict, List, NamedTuple, Tuple
+from spacy.language import Language
+from spacy.matcher import PhraseMatcher
+from spacy.tokens import Doc, Span
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "data")
+
+
+class LexiconHits(NamedTuple):
+    """Lexicon entries found in a sentence, each list ordered by priority"""
+
+    moods: List[str]
+    settings: List[str]
+    roles: List[str]
+
+
+class LexiconMatcher:
+    """Token-aware matcher over the mood, setting and role lexicons.
+
+    All terms are compiled into one PhraseMatcher (case-insensitive), so a
+    sentence is scanned once no matter how many entries the data files
+    hold, and "run" no longer matches inside "brunch".
+    """
+
+    def __init__(self, nlp: Language, data_dir: str = DATA_DIR):
+        self.nlp = nlp
+        self.matcher = PhraseMatcher(nlp.vocab, attr="LOWER")
+        # match_id -> (category, value, priority)
+        self._entries: Dict[int, Tuple[str, str, int]] = {}
+
+        moods = self._load(data_dir, "moods.json")
+        for rank, (mood, terms) in enumerate(moods.items()):
+            self._add("mood", mood, mood, rank, terms)
+
+        settings = self._load(data_dir, "settings.json")
+        for rank, (key, entry) in enumerate(settings.items()):
+            self._add("setting", key, entry["prompt"], rank, entry["terms"])
+
+        roles = self._load(data_dir, "roles.json")
+        for rank, (role, terms) in enumerate(roles.items()):
+            self._add("role", role, role, rank, terms)
+
+    def match(self, sentence: Span | Doc | str) -> LexiconHits:
+        doclike = self.nlp.make_doc(sentence) if isinstance(sentence, str) else sentence
+        found: Dict[str, Dict[str, int]] = {"mood": {}, "setting": {}, "role": {}}
+        for match_id, _, _ in self.matcher(doclike):
+            category, value, rank = self._entries[match_id]
+            found[category][value] = rank
+        return LexiconHits(
+            moods=sorted(found["mood"], key=found["mood"].get),
+            settings=sorted(found["setting"], key=found["setting"].get),
+            roles=sorted(found["role"], key=found["role"].get),
+        )
+
+    def _add(
+        self, category: str, key: str, value: str, rank: int, terms: List[str]
+    ) -> None:
+        label = f"{category}:{key}"
+        self.matcher.add(label, list(self.nlp.tokenizer.pipe(terms)))
+        self._entries[self.nlp.vocab.strings[label]] = (category, value, rank)
+
+    @staticmethod
+    def _load(data_dir: str, filename: str) -> dict:
+        with open(os.path.join(data_dir, filename), encoding="utf-8") as f:
+            return json.load(f)
+
+
+_matchers: Dict[int, LexiconMatcher] = {}
+_version: str | None = None
+_lock = threading.Lock()
+
+
+def get_lexicon(nlp: Language) -> LexiconMatcher:
+    """One compiled matcher per pipeline vocab, built on first use"""
+    key = id(nlp.vocab)
+    matcher = _matchers.get(key)
+    if matcher is None:
+        with _lock:
+            matcher = _matchers.get(key)
+            if matcher is None:
+                matcher = LexiconMatcher(nlp)
+                _matchers[key] = matcher
+    return matcher
+
+
+def lexicon_version(data_dir: str = DATA_DIR) -> str:
+    """Short hash of the lexicon and style files; changes with any entry"""
+    global _version
+    if _version is None:
+        digest = hashlib.sha256()
+        for filename in ("moods.json", "settings.json", "roles.json", "styles.json"):
+            with open(os.path.join(data_dir, filename), "rb") as f:
+                digest.update(f.read())
+        _version = digest.hexdigest()[:12]
+    return _version
@@ -0,0 +1,122 @@
+# modules/story/model_registry.py
+import os
+import threading
+import time
+import spacy
+from functools import lru_cache
+from typing import Dict
+from spacy.language import Language
+from core.logger import logger
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+SPACY_MODEL = os.getenv("SPACY_MODEL", "en_core_web_sm")
+# Rule-based pipeline for fast mode: tokenizer + punctuation sentencizer only
+FAST_MODEL = "blank:en"
+
+# The processor only reads sentence boundaries and entities, so POS tags and
+# lemmas are never needed.
+UNUSED_PIPES = ["tagger", "attribute_ruler", "lemmatizer"]
+
+
+class ModelRegistry:
+    """Loads spaCy pipelines on first use and keeps one instance per process"""
+
+    def __init__(self):
+        self._models: Dict[str, Language] = {}
+        self._stats: Dict[str, dict] = {}
+        self._lock = threading.Lock()
+
+    def get(self, name: str = SPACY_MODEL) -> Language:
+        model = self._models.get(name)
+        if model is None:
+            with self._lock:
+                model = self._models.get(name)
+                if model is None:
+                    model = self._load(name)
+                    self._models[name] = model
+        return model
+
+    def is_loaded(self, name: str = SPACY_MODEL) -> bool:
+        return name in self._models
+
+    def stats(self) -> Dict[str, dict]:
+        return {name: dict(stats) for name, stats in self._stats.items()}
+
+    def _load(self, name: str) -> Language:
+        start = time.perf_counter()
+        if name.startswith("blank:"):
+            nlp = spacy.blank(name.split(":", 1)[1])
+            nlp.add_pipe("sentencizer")
+            return self._record(name, nlp, start)
+
+        nlp = spacy.load(name, exclude=UNUSED_PIPES)
+
+        # The statistical sentence segmenter ships disabled; it is much
+        # cheaper than the dependency parser and gives us the same doc.sents
+        if "senter" in nlp.disabled and "parser" in nlp.pipe_names:
+            nlp.remove_pipe("parser")
+            nlp.enable_pipe("senter")
+
+        # Drop the shared tok2vec once nothing listens to it any more
+        if "tok2vec" in nlp.pipe_names:
+            listeners = getattr(nlp.get_pipe("tok2vec"), "listening_components", [])
+            if not listeners:
+                nlp.remove_pipe("tok2vec")
+
+        return self._record(name, nlp, start)
+
+    def _record(self, name: str, nlp: Language, start: float) -> Language:
+        elapsed = time.perf_counter() - start
+        self._stats[name] = {
+            "model": f"{nlp.meta.get('name')}-{nlp.meta.get('version')}",
+            "pipes": list(nlp.pipe_names),
+            "load_seconds": round(elapsed, 3),
+        }
+        rss = max_rss_mb()
+        if rss is not None:
+            self._stats[name]["max_rss_mb"] = rss
+        logger.info(
+            f"🧠 spaCy model '{name}' loaded in {elapsed:.2f}s "
+            f"(pipes: {', '.join(nlp.pipe_names)})"
+        )
+        return nlp
+
+
+def max_rss_mb() -> float | None:
+    """Peak resident memory of this process; None where it is not available"""
+    if resource is None:
+        return None
+    return round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1)
+
+
+registry = ModelRegistry()
+
+
+def get_nlp(name: str = SPACY_MODEL) -> Language:
+    return registry.get(name)
+
+
+@lru_cache(maxsize=None)
+def model_version(name: str = SPACY_MODEL) -> str:
+    """Name-version of the pipeline, e.g. en_core_web_sm-3.8.0.
+
+    Read from the installed package metadata so asking for it does not load
+    the model (the API process may leave NLP to its worker pool).
+    """
+    if name.startswith("blank:"):
+        return f"{name}-spacy-{spacy.__version__}"
+    version = spacy.util.get_package_version(name)
+    if version is None:
+        version = get_nlp(name).meta.get("version")
+    return f"{name}-{version}"
+
+
+def warm_up(name: str = SPACY_MODEL) -> dict:
+    """Load the model and run it once so the first request pays nothing"""
+    nlp = get_nlp(name)
+    nlp("Warm up the pipeline. It runs once per worker.")
+    return registry.stats()[name]
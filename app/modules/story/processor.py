@@ -1,101 +1,307 @@
 # modules/story/processing.py
-import spacy
+import os
 import re
-from typing import List, Dict
+from collections import defaultdict
+from typing import Any, Callable, Iterable, Iterator, List, Dict, Optional, Tuple
 from enum import Enum
+from spacy.language import Language
+from spacy.tokens import Doc, Span
+from modules.story.model_registry import FAST_MODEL, SPACY_MODEL, get_nlp, model_version
+from modules.story.cache import segmentation_cache, sentence_fingerprint
+from modules.story.lexicon import LexiconHits, get_lexicon, lexicon_version
+from modules.story.timeline import allocate_durations, build_timeline
+from modules.story.styles import get_style
+
+# Stories longer than this are parsed in paragraph-aligned windows
+CHUNK_CHARS = int(os.getenv("SEGMENT_CHUNK_CHARS", "20000"))
+
+_PARAGRAPH_BREAK = re.compile(r"\n\s*\n")
+_SENTENCE_END = re.compile(r"[.!?][\"')\]]*\s")
+
+
+def iter_story_windows(story_text: str, max_chars: int = CHUNK_CHARS) -> Iterator[str]:
+    """Yield paragraph-aligned windows of at most ``max_chars`` characters.
+
+    Paragraphs are found lazily, so only the current window is ever copied.
+    A single paragraph longer than the limit is cut at the last sentence end
+    (or whitespace) that fits.
+    """
+    if len(story_text) <= max_chars:
+        if story_text:
+            yield story_text
+        return
+
+    window, size, start = [], 0, 0
+    breaks = _PARAGRAPH_BREAK.finditer(story_text)
+    while start < len(story_text):
+        separator = next(breaks, None)
+        end = separator.start() if separator else len(story_text)
+        paragraph = story_text[start:end].strip()
+        start = separator.end() if separator else len(story_text)
+        if not paragraph:
+            continue
+
+        while len(paragraph) > max_chars:
+            if window:
+                yield "\n\n".join(window)
+                window, size = [], 0
+            cut = _split_point(paragraph, max_chars)
+            yield paragraph[:cut].strip()
+            paragraph = paragraph[cut:].strip()
+
+        if window and size + 2 + len(paragraph) > max_chars:
+            yield "\n\n".join(window)
+            window, size = [], 0
+        window.append(paragraph)
+        size += len(paragraph) + (2 if size else 0)
+
+    if window:
+        yield "\n\n".join(window)
+
+
+def _split_point(text: str, max_chars: int) -> int:
+    head = text[:max_chars]
+    ends = [m.end() for m in _SENTENCE_END.finditer(head)]
+    if ends:
+        return ends[-1]
+    space = head.rfind(" ")
+    return space if space > 0 else max_chars
+
+
+def pipe_stories(
+    stories: Iterable[Tuple[str, Any]],
+    batch_size: int = 32,
+    n_process: int = 1,
+    model: str = SPACY_MODEL,
+) -> Iterator[Tuple[Doc, Any]]:
+    """Stream (story_text, context) pairs through nlp.pipe.
+
+    Contexts travel with the docs (and get pickled when n_process > 1), so
+    keep them small, e.g. project ids.
+    """
+    texts = ((text.strip(), context) for text, context in stories)
+    return get_nlp(model).pipe(
+        texts, as_tuples=True, batch_size=batch_size, n_process=n_process
+    )
+
+
+def process_stories(
+    jobs: List[Tuple[Any, str, Dict[str, Any]]],
+    batch_size: int = 32,
+    n_process: int = 1,
+) -> Dict[Any, List[Dict]]:
+    """Segment many stories at once.
+
+    ``jobs`` are (job_id, story_text, StoryProcessing kwargs) tuples. Regular
+    stories share one nlp.pipe stream; very long ones take the chunked path.
+    Top-level and picklable so it can run inside a worker process.
+    """
+    processors = {job_id: StoryProcessing(**options) for job_id, _, options in jobs}
+    results, stories_by_model = {}, defaultdict(list)
+    for job_id, story_text, _ in jobs:
+        processor = processors[job_id]
+        if len(story_text) > processor.chunk_chars:
+            results[job_id] = processor.process_story(story_text, use_cache=False)
+        else:
+            stories_by_model[processor.model].append((story_text, job_id))
+
+    for model, stories in stories_by_model.items():
+        docs = pipe_stories(
+            stories, batch_size=batch_size, n_process=n_process, model=model
+        )
+        for doc, job_id in docs:
+            results[job_id] = processors[job_id].process_doc(doc)
+    return results
 
-# Load once
-nlp = spacy.load("en_core_web_sm")
 
 class AnimeStyle(Enum):
     SHONEN = "shonen"
     SHOJO = "shojo"
 
 
+class SegmentMode(Enum):
+    # Trained pipeline: statistical sentence boundaries + NER for characters
+    FULL = "full"
+    # Tokenizer + punctuation sentencizer, characters from the role lexicon
+    FAST = "fast"
+
+
 class StoryProcessing:
     def __init__(
         self,
         target_duration: int = 25,
         max_scenes: int = 5,
-        anime_style: AnimeStyle = AnimeStyle.SHONEN,
+        anime_style: AnimeStyle | str = AnimeStyle.SHONEN,
+        chunk_chars: int = CHUNK_CHARS,
+        mode: SegmentMode | str = SegmentMode.FULL,
     ):
         self.target_duration = target_duration
         self.max_scenes = max_scenes
         self.anime_style = anime_style
+        self.style = get_style(
+            anime_style.value if isinstance(anime_style, AnimeStyle) else anime_style
+        )
+        self.chunk_chars = chunk_chars
+        self.mode = SegmentMode(mode)
+        self.model = FAST_MODEL if self.mode is SegmentMode.FAST else SPACY_MODEL
         self.min_scene_duration = 3
 
-    def process_story(self, story_text: str) -> List[Dict]:
-        raw_scenes = self.split_into_scenes(story_text)
+    @property
+    def nlp(self) -> Language:
+        return get_nlp(self.model)
+
+    def process_story(
+        self,
+        story_text: str,
+        use_cache: bool = True,
+        on_scene: Optional[Callable[[Dict], None]] = None,
+    ) -> List[Dict]:
+        # Without use_cache the result is neither looked up nor stored
+        key = self.cache_key(story_text) if use_cache else None
+        if use_cache:
+            cached = segmentation_cache.get(key)
+            if cached is not None:
+                return cached
+
+        raw_scenes = []
+        for scene in self.iter_scenes(story_text):
+            raw_scenes.append(scene)
+            if on_scene:
+                on_scene(scene)
+        self.adjust_duration(raw_scenes)
+        if use_cache:
+            segmentation_cache.set(key, raw_scenes)
+        return raw_scenes
+
+    def cache_key(self, story_text: str) -> str:
+        return segmentation_cache.make_key(
+            story_text,
+            target_duration=self.target_duration,
+            max_scenes=self.max_scenes,
+            anime_style=self.style.name,
+            chunk_chars=self.chunk_chars,
+            model=model_version(self.model),
+            lexicon=lexicon_version(),
+        )
+
+    def process_doc(self, doc: Doc) -> List[Dict]:
+        """Same as process_story for a doc that was already analysed (nlp.pipe)"""
+        raw_scenes = self.scenes_from_doc(doc)
         self.adjust_duration(raw_scenes)
         return raw_scenes
 
     def split_into_scenes(self, story_text: str) -> List[Dict]:
-        doc = nlp(story_text.strip())
-        sentences = [s.text.strip() for s in doc.sents if s.text.strip()]
-        sentences = sentences[: self.max_scenes]
-
-        scenes = []
-        for i, sent in enumerate(sentences):
-            characters = self.extract_characters(sent)
-            bg_prompt = self.generate_background_prompt(sent, characters)
-            char_prompts = self.generate_character_prompts(characters)
-
-            scene_data = {
-                "scene_index": i,
-                "description": sent,
-                "background_prompt": bg_prompt,
-                "character_prompts": char_prompts,  # ← JSON list
-            }
-            scenes.append(scene_data)
-        return scenes
-
-    def extract_characters(self, sentence: str) -> List[str]:
+        return list(self.iter_scenes(story_text))
+
+    def iter_scenes(self, story_text: str) -> Iterator[Dict]:
+        """Yield scenes one by one as their sentence is processed.
+
+        Long stories are parsed window by window and parsing stops as soon
+        as ``max_scenes`` scenes exist, so memory stays flat no matter how
+        long the story is (and nlp.max_length never applies).
+        """
+        nlp = self.nlp
+        scene_index = 0
+        for window in iter_story_windows(story_text.strip(), self.chunk_chars):
+            for scene in self.iter_scenes_from_doc(nlp(window), scene_index):
+                yield scene
+                scene_index += 1
+            if scene_index >= self.max_scenes:
+                return
+
+    def scenes_from_doc(self, doc: Doc) -> List[Dict]:
+        return list(self.iter_scenes_from_doc(doc))
+
+    def iter_scenes_from_doc(self, doc: Doc, first_index: int = 0) -> Iterator[Dict]:
+        """Build scenes from an already analysed doc.
+
+        The story is parsed once and every step below reuses the sentence
+        spans (and their entities) of that single pass instead of running the
+        whole tagger/parser/NER pipeline a second time per sentence, so the
+        NLP cost of a story drops from ~2x its length to 1x.
+        """
+        scene_index = first_index
+        for sent in doc.sents:
+            text = sent.text.strip()
+            if not text:
+                continue
+            if scene_index >= self.max_scenes:
+                break
+            yield self.build_scene(sent, text, scene_index)
+            scene_index += 1
+
+    def build_scene(self, sent: Span | Doc, text: str, scene_index: int) -> Dict:
+        hits = self.match_lexicon(sent)
+        characters = self.extract_characters(sent, hits)
+        bg_prompt = self.generate_background_prompt(text, characters, hits)
+        char_prompts = self.generate_character_prompts(characters)
+
+        return {
+            "scene_index": scene_index,
+            "description": text,
+            "fingerprint": sentence_fingerprint(text),
+            "background_prompt": bg_prompt,
+            "character_prompts": char_prompts,  # ← JSON list
+        }
+
+    def split_sentences(self, story_text: str) -> List[str]:
+        """Sentences that would become scenes, without running NER"""
+        nlp = self.nlp
+        sentences = []
+        for window in iter_story_windows(story_text.strip(), self.chunk_chars):
+            for sent in nlp(window, disable=["ner"]).sents:
+                text = sent.text.strip()
+                if text:
+                    sentences.append(text)
+                if len(sentences) >= self.max_scenes:
+                    return sentences
+        return sentences
+
+    def scenes_for_sentences(self, sentences: List[Tuple[int, str]]) -> List[Dict]:
+        """Run the full pipeline on (scene_index, sentence) pairs only"""
+        docs = self.nlp.pipe(text for _, text in sentences)
+        return [
+            self.build_scene(doc, text, index)
+            for (index, text), doc in zip(sentences, docs)
+        ]
+
+    def match_lexicon(self, sentence: Span | Doc | str) -> LexiconHits:
+        """Scan a sentence once for every mood, setting and role term"""
+        return get_lexicon(self.nlp).match(sentence)
+
+    def extract_characters(
+        self, sentence: Span | str, hits: LexiconHits | None = None
+    ) -> List[str]:
         """Find 1–3 character names from sentence"""
-        doc = nlp(sentence)
-        # Look for proper nouns (likely characters)
-        candidates = [ent.text for ent in doc.ents if ent.label_ in ["PERSON", "ORG"]]
+        # Reuse the entities of the story-level parse when we get a span
+        span = sentence if isinstance(sentence, (Span, Doc)) else self.nlp(sentence)
+        # Look for proper nouns (likely characters); fast mode has no NER
+        # and always takes the lexicon fallback
+        candidates = [ent.text for ent in span.ents if ent.label_ in ["PERSON", "ORG"]]
         if not candidates:
             # Fallback: common roles
-            keywords = ["knight", "princess", "dragon", "wolf", "king", "hero", "girl", "boy"]
-            candidates = [w for w in keywords if w in sentence.lower()]
+            candidates = (hits or self.match_lexicon(span)).roles
         return list(dict.fromkeys(candidates))[:3]  # dedupe + max 3
 
-    def generate_background_prompt(self, desc: str, characters: List[str]) -> str:
-        style = "shonen anime style, vibrant colors" if self.anime_style == AnimeStyle.SHONEN else "shojo anime style, soft pastel"
-        mood = self.detect_mood(desc)
-        setting = self.extract_setting(desc)
-        return f"{setting}, {', '.join(characters)}, {mood} mood, {style}, detailed background, 2D animation"
+    def generate_background_prompt(
+        self, desc: str, characters: List[str], hits: LexiconHits | None = None
+    ) -> str:
+        hits = hits or self.match_lexicon(desc)
+        mood = self.detect_mood(desc, hits)
+        setting = self.extract_setting(desc, hits)
+        return self.style.background_prompt(setting, characters, mood)
 
     def generate_character_prompts(self, characters: List[str]) -> List[str]:
         """One prompt per character → transparent PNG"""
-        base = "anime style, detailed, transparent background, character only"
-        style_suffix = ", shonen" if self.anime_style == AnimeStyle.SHONEN else ", shojo"
-        return [f"{char}{style_suffix}, {base}" for char in characters or ["Character"]]
-
-    def detect_mood(self, sentence: str) -> str:
-        s = sentence.lower()
-        if any(w in s for w in ["fight", "battle", "run", "shout", "sword"]):
-            return "exciting"
-        if any(w in s for w in ["love", "kiss", "hug", "heart"]):
-            return "romantic"
-        if any(w in s for w in ["sad", "cry", "tear", "lonely"]):
-            return "emotional"
-        return "neutral"
-
-    def extract_setting(self, sentence: str) -> str:
-        s = sentence.lower()
-        settings = {
-            "forest": "dense forest, tall trees",
-            "cave": "dark cave, glowing crystals",
-            "river": "rushing river, rocks",
-            "castle": "grand castle, stone walls",
-            "village": "cozy village, wooden houses",
-            "mountain": "snowy mountain peak",
-        }
-        for key, prompt in settings.items():
-            if key in s:
-                return prompt
-        return "scene"
+        return self.style.character_prompts(characters)
+
+    def detect_mood(self, sentence: str, hits: LexiconHits | None = None) -> str:
+        moods = (hits or self.match_lexicon(sentence)).moods
+        return moods[0] if moods else "neutral"
+
+    def extract_setting(self, sentence: str, hits: LexiconHits | None = None) -> str:
+        settings = (hits or self.match_lexicon(sentence)).settings
+        return settings[0] if settings else "scene"
 
     def calculate_duration(self, sentence: str) -> int:
         words = len(sentence.split())
@@ -110,19 +316,11 @@ class StoryProcessing:
         return sum(self.calculate_duration(s["description"]) for s in scenes)
 
     def adjust_duration(self, scenes: List[Dict]) -> None:
-        total = self.total_duration(scenes)
-        target = self.target_duration
-
-        # Increase
-        while total < target and any(self.calculate_duration(s["description"]) < 8 for s in scenes):
-            for s in scenes:
-                if self.calculate_duration(s["description"]) < 8:
-                    total += 1
-                    break
-
-        # Decrease
-        while total > target + 5 and any(self.calculate_duration(s["description"]) > 3 for s in scenes):
-            for s in scenes:
-                if self.calculate_duration(s["description"]) > 3:
-                    total -= 1
-                    break
\ No newline at end of file
+        """Assign duration_sec/start_sec so the scenes fill target_duration"""
+        weights = [self.calculate_duration(s["description"]) for s in scenes]
+        durations = allocate_durations(weights, self.target_duration or sum(weights))
+        for scene, duration, start in zip(
+            scenes, durations, build_timeline(durations)
+        ):
+            scene["duration_sec"] = duration
+            scene["start_sec"] = start
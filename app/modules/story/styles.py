@@ -0,0 +1,92 @@
+# modules/story/styles.py
+import os
+import json
+from typing import List, Optional, Tuple
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "data")
+DEFAULT_STYLE = "shonen"
+
+BACKGROUND_SUFFIX = "detailed background, 2D animation"
+CHARACTER_BASE = "anime style, detailed, transparent background, character only"
+
+
+class Style:
+    """Prompt wording of one anime style"""
+
+    def __init__(self, name: str, background: str, character: str):
+        self.name = name
+        self.background = background
+        self.character = character
+        # What every prompt of this style ends with
+        self.background_tail = f", {background}, {BACKGROUND_SUFFIX}"
+        self.character_tail = f", {character}, {CHARACTER_BASE}"
+
+    def background_prompt(self, setting: str, characters: List[str], mood: str) -> str:
+        return f"{setting}, {', '.join(characters)}, {mood} mood{self.background_tail}"
+
+    def character_prompts(self, characters: List[str]) -> List[str]:
+        return [char + self.character_tail for char in characters or ["Character"]]
+
+    def restyle(
+        self, background_prompt: str | None, character_prompts: List[str], style: "Style"
+    ) -> Optional[Tuple[str, List[str]]]:
+        """Prompts of this style with its wording swapped for ``style``'s,
+        or None if they were not generated with this style"""
+        if not (background_prompt or "").endswith(self.background_tail):
+            return None
+        if not all(p.endswith(self.character_tail) for p in character_prompts):
+            return None
+        return (
+            background_prompt[: -len(self.background_tail)] + style.background_tail,
+            [p[: -len(self.character_tail)] + style.character_tail for p in character_prompts],
+        )
+
+
+class StyleRegistry:
+    def __init__(self, data_dir: str = DATA_DIR):
+        with open(os.path.join(data_dir, "styles.json"), encoding="utf-8") as f:
+            styles = json.load(f)
+        self._styles = {
+            name: Style(name, entry["background"], entry["character"])
+            for name, entry in styles.items()
+        }
+
+    def get(self, name: str) -> Style:
+        try:
+            return self._styles[name]
+        except KeyError:
+            raise ValueError(f"Unknown anime style '{name}'") from None
+
+    def names(self) -> List[str]:
+        return list(self._styles)
+
+    def restyle(
+        self, background_prompt: str | None, character_prompts: List[str], style: Style
+    ) -> Optional[Tuple[str, List[str]]]:
+        """Generated prompts of any registered style, rewritten in ``style``.
+
+        Only the style wording changes, so no NLP is needed. None when the
+        prompts match no registered style (e.g. they were edited by hand).
+        """
+        for source in (style, *self._styles.values()):
+            prompts = source.restyle(background_prompt, character_prompts, style)
+            if prompts is not None:
+                return prompts
+        return None
+
+
+style_registry = StyleRegistry()
+
+
+def get_style(name: str = DEFAULT_STYLE) -> Style:
+    return style_registry.get(name)
+
+
+def available_styles() -> List[str]:
+    return style_registry.names()
+
+
+def restyle_prompts(
+    background_prompt: str | None, character_prompts: List[str], style: Style
+) -> Optional[Tuple[str, List[str]]]:
+    return style_registry.restyle(background_prompt, character_prompts, style)
@@ -0,0 +1,91 @@
+# modules/story/timeline.py
+import numpy as np
+from typing import List, Sequence
+
+MIN_SCENE_SEC = 3
+MAX_SCENE_SEC = 8
+
+# Below this many scenes the plain Python sweep beats numpy's call overhead
+VECTORIZE_THRESHOLD = 256
+
+
+def allocate_durations(
+    weights: Sequence[float],
+    target: float,
+    lo: float = MIN_SCENE_SEC,
+    hi: float = MAX_SCENE_SEC,
+) -> List[float]:
+    """Split ``target`` seconds over scenes in one pass.
+
+    Every scene gets ``clamp(weight + shift, lo, hi)`` where the single
+    ``shift`` is solved in closed form so the durations add up to the target
+    (clamped to what the bounds allow). Longer sentences stay longer, and the
+    result is rounded to centiseconds without breaking the total or bounds.
+    """
+    n = len(weights)
+    if n == 0:
+        return []
+    target = min(max(float(target), n * lo), n * hi)
+
+    if n >= VECTORIZE_THRESHOLD:
+        durations = _allocate_vectorized(weights, target, lo, hi)
+    else:
+        shift = _solve_shift(weights, target, lo, hi)
+        durations = [min(max(w + shift, lo), hi) for w in weights]
+    return _round_preserving_total(durations, target)
+
+
+def build_timeline(durations: Sequence[float]) -> List[float]:
+    """Start offset (seconds) of every scene"""
+    starts, elapsed = [], 0.0
+    for duration in durations:
+        starts.append(round(elapsed, 2))
+        elapsed += duration
+    return starts
+
+
+def _solve_shift(weights: Sequence[float], target: float, lo: float, hi: float) -> float:
+    # sum(clamp(w + shift)) is piecewise linear in shift; walk its breakpoints
+    events = sorted([(lo - w, 1) for w in weights] + [(hi - w, -1) for w in weights])
+    value, slope, prev = len(weights) * lo, 0, events[0][0]
+    for point, change in events:
+        reached = value + slope * (point - prev)
+        if reached >= target and slope > 0:
+            return prev + (target - value) / slope
+        value, prev = reached, point
+        slope += change
+    return prev
+
+
+def _allocate_vectorized(
+    weights: Sequence[float], target: float, lo: float, hi: float
+) -> List[float]:
+    w = np.asarray(weights, dtype=float)
+    points = np.concatenate((lo - w, hi - w))
+    changes = np.concatenate((np.ones(len(w)), -np.ones(len(w))))
+    order = np.argsort(points, kind="stable")
+    points, changes = points[order], changes[order]
+
+    slopes = np.concatenate(([0.0], np.cumsum(changes)[:-1]))
+    values = len(w) * lo + np.cumsum(slopes * np.diff(points, prepend=points[0]))
+    k = int(np.searchsorted(values, target))
+    if k == 0:
+        shift = points[0]
+    elif k >= len(points):
+        shift = points[-1]
+    else:
+        shift = points[k - 1] + (target - values[k - 1]) / slopes[k]
+    return np.clip(w + shift, lo, hi).tolist()
+
+
+def _round_preserving_total(durations: Sequence[float], target: float) -> List[float]:
+    # Largest-remainder rounding in centiseconds
+    centis = [d * 100 for d in durations]
+    floors = [int(c) for c in centis]
+    remainder = int(round(target * 100)) - sum(floors)
+    by_fraction = sorted(
+        range(len(centis)), key=lambda i: centis[i] - floors[i], reverse=True
+    )
+    for i in by_fraction[: max(remainder, 0)]:
+        floors[i] += 1
+    return [f / 100 for f in floors]
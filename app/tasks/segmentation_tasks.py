@@ -0,0 +1,26 @@
+from celery import shared_task
+
+
+@shared_task(bind=True, name="app.tasks.segmentation_tasks.segment_project")
+def segment_project(self, project_id: int, user_id: int, style: str = "shonen"):
+    # Imported lazily: the scene service imports this module to enqueue jobs
+    from modules.scene.service import SceneService
+    from database.session import session_scope
+
+    def report_progress(scenes_done: int, max_scenes: int):
+        self.update_state(
+            state="PROGRESS",
+            meta={
+                "project_id": project_id,
+                "scenes_done": scenes_done,
+                "max_scenes": max_scenes,
+            },
+        )
+
+    with session_scope() as db:
+        result = SceneService(db).segment_story(
+            project_id, user_id, on_progress=report_progress, style=style
+        )
+    if result.status_code != 200:
+        raise RuntimeError(result.message)
+    return result.model_dump()
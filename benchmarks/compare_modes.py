@@ -0,0 +1,164 @@
+"""Compare fast (rule-based) and full (trained pipeline) segmentation.
+
+Runs both StoryProcessing modes over the stories in benchmarks/corpus and
+reports per-story latency plus how far the fast output drifts from the
+full one:
+
+    python benchmarks/compare_modes.py
+    python benchmarks/compare_modes.py --output benchmarks/modes.json
+
+sentence_f1        overlap of the sentence boundaries (by fingerprint)
+same_characters    share of common sentences with identical characters
+same_background    share of common sentences with identical background prompt
+
+It also checks the full mode's sentence boundaries against the dependency
+parser's. The model registry swaps the parser for the cheaper senter, which
+can split some sentences differently; --require-parser-boundaries exits with
+code 1 when any story's boundaries differ.
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import spacy
+
+APP_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "app"))
+sys.path.insert(0, APP_DIR)
+
+from modules.story.model_registry import SPACY_MODEL, UNUSED_PIPES, get_nlp  # noqa: E402
+from modules.story.processor import SegmentMode, StoryProcessing, iter_story_windows  # noqa: E402
+from story_processing import CORPUS_DIR, load_corpus  # noqa: E402
+
+
+def time_mode(processor: StoryProcessing, story_text: str, repeat: int) -> tuple:
+    scenes = processor.process_story(story_text, use_cache=False)  # warm up
+    start = time.perf_counter()
+    for _ in range(repeat):
+        processor.process_story(story_text, use_cache=False)
+    return scenes, (time.perf_counter() - start) / repeat
+
+
+def diff_scenes(full: list, fast: list) -> dict:
+    full_by_fp = {s["fingerprint"]: s for s in full}
+    fast_by_fp = {s["fingerprint"]: s for s in fast}
+    common = full_by_fp.keys() & fast_by_fp.keys()
+    precision = len(common) / len(fast_by_fp) if fast_by_fp else 0.0
+    recall = len(common) / len(full_by_fp) if full_by_fp else 0.0
+    f1 = 2 * precision * recall / (precision + recall) if common else 0.0
+
+    def share(field: str) -> float:
+        if not common:
+            return 0.0
+        same = sum(full_by_fp[fp][field] == fast_by_fp[fp][field] for fp in common)
+        return round(same / len(common), 3)
+
+    return {
+        "full_scenes": len(full),
+        "fast_scenes": len(fast),
+        "sentence_f1": round(f1, 3),
+        # character prompts are one per character, so equal lists = equal casts
+        "same_characters": share("character_prompts"),
+        "same_background": share("background_prompt"),
+    }
+
+
+def sentence_starts(nlp, story_text: str) -> set:
+    """(window, offset) pairs where sentences start, over the processor's windows"""
+    return {
+        (i, sent.start_char)
+        for i, window in enumerate(iter_story_windows(story_text.strip()))
+        for sent in nlp(window).sents
+    }
+
+
+def diff_boundaries(corpus_dir: str) -> dict:
+    """Sentence starts of the registry pipeline (senter) vs. the parser"""
+    parser_nlp = spacy.load(SPACY_MODEL, exclude=UNUSED_PIPES)
+    senter_nlp = get_nlp(SPACY_MODEL)
+    stories = {}
+    for name, text in load_corpus(corpus_dir).items():
+        parsed = sentence_starts(parser_nlp, text)
+        sentered = sentence_starts(senter_nlp, text)
+        common = len(parsed & sentered)
+        stories[name] = {
+            "parser_sentences": len(parsed),
+            "senter_sentences": len(sentered),
+            "boundary_f1": round(2 * common / (len(parsed) + len(sentered)), 3),
+            "identical": parsed == sentered,
+        }
+    return stories
+
+
+def run(corpus_dir: str, repeat: int, max_scenes: int) -> dict:
+    options = {"target_duration": 25, "max_scenes": max_scenes}
+    full = StoryProcessing(mode=SegmentMode.FULL, **options)
+    fast = StoryProcessing(mode=SegmentMode.FAST, **options)
+
+    stories = {}
+    for name, text in load_corpus(corpus_dir).items():
+        full_scenes, full_seconds = time_mode(full, text, repeat)
+        fast_scenes, fast_seconds = time_mode(fast, text, repeat)
+        stories[name] = {
+            "chars": len(text),
+            "full_ms": round(full_seconds * 1000, 3),
+            "fast_ms": round(fast_seconds * 1000, 3),
+            "speedup": round(full_seconds / fast_seconds, 1) if fast_seconds else None,
+            **diff_scenes(full_scenes, fast_scenes),
+        }
+    return {
+        "repeat": repeat,
+        "max_scenes": max_scenes,
+        "stories": stories,
+        "senter_vs_parser": diff_boundaries(corpus_dir),
+    }
+
+
+def print_report(report: dict) -> None:
+    print(
+        f"{'story':<24} {'chars':>7} {'full ms':>9} {'fast ms':>9} {'speedup':>8} "
+        f"{'scenes':>9} {'sent F1':>8} {'chars=':>7} {'bg=':>6}"
+    )
+    for name, s in report["stories"].items():
+        print(
+            f"{name:<24} {s['chars']:>7} {s['full_ms']:>9.3f} {s['fast_ms']:>9.3f} "
+            f"{s['speedup']:>7}x {s['full_scenes']:>4}/{s['fast_scenes']:<4} "
+            f"{s['sentence_f1']:>8.3f} {s['same_characters']:>7.3f} {s['same_background']:>6.3f}"
+        )
+    print(f"\n{'senter vs parser':<24} {'parser':>7} {'senter':>7} {'F1':>6}  identical")
+    for name, b in report["senter_vs_parser"].items():
+        print(
+            f"{name:<24} {b['parser_sentences']:>7} {b['senter_sentences']:>7} "
+            f"{b['boundary_f1']:>6.3f}  {'yes' if b['identical'] else 'NO'}"
+        )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--corpus", default=CORPUS_DIR)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument(
+        "--max-scenes", type=int, default=1000, help="compare whole stories by default"
+    )
+    parser.add_argument("--output", help="write the report as JSON")
+    parser.add_argument(
+        "--require-parser-boundaries",
+        action="store_true",
+        help="exit with 1 when the senter splits any story differently from the parser",
+    )
+    args = parser.parse_args()
+
+    report = run(args.corpus, args.repeat, args.max_scenes)
+    print_report(report)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    if args.require_parser_boundaries and not all(
+        b["identical"] for b in report["senter_vs_parser"].values()
+    ):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,305 @@
+"""Check that the hot repository queries are served by indexes.
+
+Runs the repository methods against the configured database (DATABASE_URL and
+ASYNC_DATABASE_URL, e.g. a local MySQL or a SQLite file), captures the SQL
+they send and prints its EXPLAIN (MySQL) or EXPLAIN QUERY PLAN (SQLite).
+
+    DATABASE_URL=sqlite:///./explain.db ASYNC_DATABASE_URL=sqlite+aiosqlite:///./explain.db \\
+        python benchmarks/explain_queries.py --seed 2000
+
+The exit code is 1 when any query reads a whole table instead of an index.
+"""
+import os
+import re
+import sys
+import asyncio
+import argparse
+from datetime import datetime, timedelta
+
+APP_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "app"))
+sys.path[:0] = [APP_DIR, os.path.dirname(APP_DIR)]
+
+from sqlalchemy import event, func, insert, select  # noqa: E402
+from database.session import async_engine, async_session, base, engine, session  # noqa: E402
+from app.database.models.user import User  # noqa: E402
+from app.database.models.project import Project  # noqa: E402
+from app.database.models.scene import Scene  # noqa: E402
+from app.database.models.asset import Asset  # noqa: E402
+from modules.project.repository import AsyncProjectRepository, ProjectRepository  # noqa: E402
+from modules.scene.repository import _inserted_rows_query, _replace_scenes  # noqa: E402
+from modules.admin.users.repository import AdminUserRepository  # noqa: E402
+
+SCENES_PER_PROJECT = 5
+ASSET_TYPES = ("background", "character", "audio")
+# SQLite: "SCAN projects" reads the table; "SCAN .. USING INDEX" and
+# "SEARCH .." go through an index
+_SQLITE_FULL_SCAN = re.compile(r"^SCAN (\w+)$")
+# Scanning a derived table (e.g. the one-row subquery of a joined load) is fine
+_DERIVED = re.compile(r"^(anon_\d+|<.+>)$")
+
+
+class StatementLog:
+    """Collects the SELECT/UPDATE/DELETE statements sent while it is active"""
+
+    def __init__(self):
+        self.statements = []
+        self.active = False
+
+    def __call__(self, conn, cursor, statement, parameters, context, executemany):
+        verb = statement.lstrip().split(None, 1)[0].upper()
+        if self.active and not executemany and verb in {"SELECT", "UPDATE", "DELETE"}:
+            self.statements.append((statement, parameters))
+
+    def capture(self, fn):
+        self.statements, self.active = [], True
+        try:
+            fn()
+        finally:
+            self.active = False
+        return self.statements
+
+
+def seed(projects: int) -> None:
+    """Insert ``projects`` projects spread over users, with scenes and assets"""
+    users = max(projects // 20, 1)
+    started = datetime(2024, 1, 1)
+    with engine.begin() as conn:
+        first_user = (conn.execute(select(func.max(User.id))).scalar() or 0) + 1
+        conn.execute(
+            insert(User),
+            [
+                {
+                    "fullName": f"Seed User {first_user + i}",
+                    "email": f"seed{first_user + i}@example.com",
+                    "password": "x",
+                    "role": "admin" if i % 50 == 0 else "user",
+                    "created_at": started + timedelta(minutes=i),
+                    "updated_at": started + timedelta(minutes=i),
+                }
+                for i in range(users)
+            ],
+        )
+        first_project = (conn.execute(select(func.max(Project.id))).scalar() or 0) + 1
+        conn.execute(
+            insert(Project),
+            [
+                {
+                    "user_id": first_user + i % users,
+                    "title": f"Seed project {i}",
+                    "story_text": "A seeded story.",
+                    "duration_sec": 20,
+                    "status": "segmented",
+                    "created_at": started + timedelta(minutes=i),
+                    "updated_at": started + timedelta(minutes=i),
+                }
+                for i in range(projects)
+            ],
+        )
+        project_ids = range(first_project, first_project + projects)
+        conn.execute(
+            insert(Scene),
+            [
+                {
+                    "project_id": project_id,
+                    "scene_index": index,
+                    "description": f"Scene {index}.",
+                    "character_prompts": [],
+                }
+                for project_id in project_ids
+                for index in range(SCENES_PER_PROJECT)
+            ],
+        )
+        conn.execute(
+            insert(Asset),
+            [
+                {"project_id": project_id, "type": kind, "file_path": f"/seed/{project_id}/{kind}"}
+                for project_id in project_ids
+                for kind in ASSET_TYPES
+            ],
+        )
+    analyze()
+
+
+def analyze() -> None:
+    """Refresh planner statistics so the plans match a real table"""
+    with engine.begin() as conn:
+        if engine.dialect.name == "mysql":
+            conn.exec_driver_sql("ANALYZE TABLE users, projects, scenes, assets")
+        else:
+            conn.exec_driver_sql("ANALYZE")
+
+
+def sample_ids() -> tuple[int, int, list[int]]:
+    """A user owning several projects, one of them, and a page of them"""
+    with session() as db:
+        user_id = db.scalar(
+            select(Project.user_id)
+            .group_by(Project.user_id)
+            .order_by(func.count().desc())
+            .limit(1)
+        )
+        if user_id is None:
+            raise SystemExit("The database is empty; run with --seed N first")
+        project_ids = db.scalars(
+            select(Project.id).where(Project.user_id == user_id).limit(10)
+        ).all()
+    return user_id, project_ids[0], list(project_ids)
+
+
+def run_async(coro_fn):
+    async def call():
+        async with async_session() as db:
+            await coro_fn(db)
+        # Pooled connections belong to this event loop
+        await async_engine.dispose()
+
+    return lambda: asyncio.run(call())
+
+
+def run_sync(fn):
+    def call():
+        with session() as db:
+            fn(db)
+
+    return call
+
+
+def run_rolled_back(stmt):
+    def call():
+        with engine.connect() as conn:
+            with conn.begin() as trans:
+                conn.execute(stmt)
+                trans.rollback()
+
+    return call
+
+
+def checks(user_id: int, project_id: int, project_ids: list[int]) -> list:
+    with session() as db:
+        newest = db.execute(
+            select(Project.created_at, Project.id)
+            .where(Project.user_id == user_id)
+            .order_by(Project.created_at.desc(), Project.id.desc())
+            .limit(1)
+        ).one()
+        newest_user = db.execute(
+            select(User.created_at, User.id).order_by(User.id.desc()).limit(1)
+        ).one()
+    return [
+        (
+            "project detail (ORM, joined scenes)",
+            run_sync(lambda db: ProjectRepository(db).get_by_id(project_id, user_id)),
+        ),
+        (
+            "project detail (columns)",
+            run_async(lambda db: AsyncProjectRepository(db).get_detail(project_id, user_id)),
+        ),
+        (
+            "projects by ids (batch)",
+            run_async(
+                lambda db: AsyncProjectRepository(db).get_many_by_ids(project_ids, user_id)
+            ),
+        ),
+        (
+            "project list, next page",
+            run_async(
+                lambda db: AsyncProjectRepository(db).list_summaries(
+                    user_id, 20, tuple(newest)
+                )
+            ),
+        ),
+        (
+            "project list with scene counts",
+            run_async(
+                lambda db: AsyncProjectRepository(db).list_summaries(
+                    user_id, 20, with_scene_count=True
+                )
+            ),
+        ),
+        ("replace a project's scenes", run_rolled_back(_replace_scenes([project_id]))),
+        ("inserted scenes (no RETURNING)", run_rolled_back(_inserted_rows_query([project_id]))),
+        (
+            "project assets by type",
+            run_rolled_back(
+                select(Asset.id, Asset.file_path).where(
+                    Asset.project_id == project_id, Asset.type == "background"
+                )
+            ),
+        ),
+        (
+            "admin users by role, next page",
+            run_sync(
+                lambda db: AdminUserRepository(db).list_users(
+                    None, "user", 20, tuple(newest_user)
+                )
+            ),
+        ),
+    ]
+
+
+def explain(statement: str, parameters) -> tuple[list[str], list[str]]:
+    """Plan lines of a captured statement and the tables it reads in full"""
+    with engine.connect() as conn:
+        if engine.dialect.name == "mysql":
+            rows = conn.exec_driver_sql(f"EXPLAIN {statement}", parameters).mappings().all()
+            lines = [
+                f"{r['table']}: type={r['type']} key={r['key']} rows={r['rows']} "
+                f"{r['Extra'] or ''}".rstrip()
+                for r in rows
+            ]
+            scans = [
+                r["table"]
+                for r in rows
+                if r["type"] == "ALL" and not _DERIVED.match(r["table"])
+            ]
+        else:
+            rows = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).all()
+            lines = [r[-1] for r in rows]
+            scans = [
+                m.group(1)
+                for m in map(_SQLITE_FULL_SCAN.match, lines)
+                if m and not _DERIVED.match(m.group(1))
+            ]
+    return lines, scans
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--seed", type=int, default=0, help="insert this many projects (with scenes and assets) first"
+    )
+    args = parser.parse_args()
+
+    engine.echo = async_engine.echo = False
+    # No-op on a migrated database; creates the schema of a fresh SQLite file
+    base.metadata.create_all(engine)
+    if args.seed:
+        seed(args.seed)
+
+    log = StatementLog()
+    event.listen(engine, "before_cursor_execute", log)
+    event.listen(async_engine.sync_engine, "before_cursor_execute", log)
+
+    failures = []
+    for name, run in checks(*sample_ids()):
+        for statement, parameters in log.capture(run):
+            lines, scans = explain(statement, parameters)
+            status = "FULL SCAN" if scans else "ok"
+            print(f"{name:<36} {status}")
+            for line in lines:
+                print(f"{'':<4}{line}")
+            if scans:
+                failures.append(f"{name} ({', '.join(scans)})")
+
+    if engine.dialect.name != "mysql":
+        # Without FULLTEXT the search is a substring LIKE, a scan by design
+        print("admin user search: not checked (FULLTEXT is MySQL only)")
+
+    if failures:
+        print(f"Queries reading whole tables: {'; '.join(failures)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,106 @@
+"""Micro-benchmark: style registry prompts vs. the old per-scene string building.
+
+    python benchmarks/prompt_templates.py --scenes 200000
+
+The legacy functions below are the prompt builders StoryProcessing used
+before the style registry; outputs are checked to be identical first. The
+registry is also timed with many extra styles registered, to show that the
+per-scene cost does not grow with the number of styles.
+"""
+import os
+import sys
+import json
+import random
+import argparse
+import tempfile
+import timeit
+
+APP_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "app"))
+sys.path.insert(0, APP_DIR)
+
+from modules.story.styles import DATA_DIR, StyleRegistry, get_style  # noqa: E402
+
+MOODS = ["exciting", "romantic", "emotional", "neutral"]
+SETTINGS = ["dense forest, tall trees", "dark cave, glowing crystals", "scene"]
+CHARACTERS = [[], ["knight"], ["Aiko", "Renji"], ["Aiko", "Renji", "Hana"]]
+
+
+def legacy_background_prompt(style_name: str, setting: str, characters: list, mood: str) -> str:
+    style = "shonen anime style, vibrant colors" if style_name == "shonen" else "shojo anime style, soft pastel"
+    return f"{setting}, {', '.join(characters)}, {mood} mood, {style}, detailed background, 2D animation"
+
+
+def legacy_character_prompts(style_name: str, characters: list) -> list:
+    base = "anime style, detailed, transparent background, character only"
+    style_suffix = ", shonen" if style_name == "shonen" else ", shojo"
+    return [f"{char}{style_suffix}, {base}" for char in characters or ["Character"]]
+
+
+def make_scenes(count: int, seed: int = 7) -> list:
+    rng = random.Random(seed)
+    return [
+        (rng.choice(SETTINGS), rng.choice(CHARACTERS), rng.choice(MOODS))
+        for _ in range(count)
+    ]
+
+
+def large_registry(extra: int) -> StyleRegistry:
+    """The shipped styles plus ``extra`` generated ones"""
+    with open(os.path.join(DATA_DIR, "styles.json"), encoding="utf-8") as f:
+        styles = json.load(f)
+    for i in range(extra):
+        styles[f"generated{i}"] = {"background": f"style {i} anime style", "character": f"style {i}"}
+    with tempfile.TemporaryDirectory() as data_dir:
+        with open(os.path.join(data_dir, "styles.json"), "w", encoding="utf-8") as f:
+            json.dump(styles, f)
+        return StyleRegistry(data_dir)
+
+
+def run_legacy(style_name: str, scenes: list) -> None:
+    for setting, characters, mood in scenes:
+        legacy_background_prompt(style_name, setting, characters, mood)
+        legacy_character_prompts(style_name, characters)
+
+
+def run_registry(registry: StyleRegistry, style_name: str, scenes: list) -> None:
+    style = registry.get(style_name)
+    for setting, characters, mood in scenes:
+        style.background_prompt(setting, characters, mood)
+        style.character_prompts(characters)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scenes", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--extra-styles", type=int, default=1000)
+    args = parser.parse_args()
+
+    scenes = make_scenes(args.scenes)
+    for style_name in ("shonen", "shojo"):
+        style = get_style(style_name)
+        for setting, characters, mood in scenes[:1000]:
+            assert style.background_prompt(setting, characters, mood) == legacy_background_prompt(
+                style_name, setting, characters, mood
+            )
+            assert style.character_prompts(characters) == legacy_character_prompts(
+                style_name, characters
+            )
+
+    registries = {"registry": StyleRegistry(), f"+{args.extra_styles} styles": large_registry(args.extra_styles)}
+
+    def ns_per_scene(fn) -> float:
+        return min(timeit.repeat(fn, number=1, repeat=args.repeat)) / args.scenes * 1e9
+
+    for style_name in ("shonen", "shojo"):
+        legacy = ns_per_scene(lambda: run_legacy(style_name, scenes))
+        timings = "   ".join(
+            f"{label} {ns_per_scene(lambda: run_registry(registry, style_name, scenes)):8.1f} ns/scene"
+            for label, registry in registries.items()
+        )
+        print(f"{style_name:<8} legacy {legacy:8.1f} ns/scene   {timings}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,248 @@
+"""Benchmark the story processing pipeline.
+
+Runs StoryProcessing stage by stage over the stories in benchmarks/corpus
+and reports throughput, per-stage timings and peak memory.
+
+    python benchmarks/story_processing.py --output benchmarks/baseline.json
+    python benchmarks/story_processing.py --compare benchmarks/baseline.json --threshold 0.1
+
+In compare mode the exit code is 1 when sentences/sec of any story (or of
+the whole corpus) drops by more than the threshold against the baseline,
+and 2 when the baseline was recorded with a different pipeline.
+"""
+import gc
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+import tracemalloc
+from collections import defaultdict
+
+APP_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "app"))
+sys.path.insert(0, APP_DIR)
+
+import spacy  # noqa: E402
+from modules.story.model_registry import max_rss_mb, model_version  # noqa: E402
+from modules.story.processor import (  # noqa: E402
+    AnimeStyle,
+    SegmentMode,
+    StoryProcessing,
+    iter_story_windows,
+)
+
+CORPUS_DIR = os.path.join(os.path.dirname(__file__), "corpus")
+
+# Pipeline components grouped into the stages we report
+STAGE_OF_PIPE = {
+    "senter": "sentence_split",
+    "parser": "sentence_split",
+    "sentencizer": "sentence_split",
+    "ner": "ner",
+}
+
+
+def load_corpus(corpus_dir: str) -> dict:
+    stories = {}
+    for filename in sorted(os.listdir(corpus_dir)):
+        if filename.endswith(".txt"):
+            with open(os.path.join(corpus_dir, filename), encoding="utf-8") as f:
+                stories[filename[:-4]] = f.read()
+    return stories
+
+
+def run_once(processor: StoryProcessing, story_text: str) -> dict:
+    """Mirror StoryProcessing.process_story while timing every stage"""
+    nlp = processor.nlp
+    stages = defaultdict(float)
+    sentences = 0
+    scenes = []
+
+    for window in iter_story_windows(story_text.strip(), processor.chunk_chars):
+        start = time.perf_counter()
+        doc = nlp.make_doc(window)
+        stages["tokenize"] += time.perf_counter() - start
+
+        for name, pipe in nlp.pipeline:
+            start = time.perf_counter()
+            doc = pipe(doc)
+            stages[STAGE_OF_PIPE.get(name, "other_pipes")] += time.perf_counter() - start
+
+        sentences += sum(1 for _ in doc.sents)
+        start = time.perf_counter()
+        scenes.extend(processor.iter_scenes_from_doc(doc, len(scenes)))
+        stages["prompt_generation"] += time.perf_counter() - start
+        if len(scenes) >= processor.max_scenes:
+            break
+
+    start = time.perf_counter()
+    processor.adjust_duration(scenes)
+    stages["duration_adjustment"] += time.perf_counter() - start
+
+    return {"stages": dict(stages), "sentences": sentences, "scenes": len(scenes)}
+
+
+def bench_story(story_text: str, repeat: int, rounds: int, max_scenes: int, mode: str) -> dict:
+    processor = StoryProcessing(
+        target_duration=25, max_scenes=max_scenes, anime_style=AnimeStyle.SHONEN, mode=mode
+    )
+    run_once(processor, story_text)  # warm caches, lexicon matcher etc.
+
+    # Best of ``rounds`` rounds with the garbage collector off, as timeit
+    # does: slower rounds measure whatever else the machine was doing
+    best = None
+    gc.collect()
+    gc.disable()
+    try:
+        for _ in range(rounds):
+            totals = defaultdict(float)
+            sentences = scenes = 0
+            start = time.perf_counter()
+            for _ in range(repeat):
+                result = run_once(processor, story_text)
+                for stage, seconds in result["stages"].items():
+                    totals[stage] += seconds
+                sentences += result["sentences"]
+                scenes += result["scenes"]
+            elapsed = time.perf_counter() - start
+            if best is None or elapsed < best[0]:
+                best = (elapsed, totals, sentences, scenes)
+    finally:
+        gc.enable()
+    elapsed, totals, sentences, scenes = best
+
+    # Tracing slows every allocation, so memory gets a run of its own
+    tracemalloc.start()
+    run_once(processor, story_text)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "chars": len(story_text),
+        "sentences": sentences // repeat,
+        "scenes": scenes // repeat,
+        "seconds_per_run": round(elapsed / repeat, 6),
+        "sentences_per_sec": round(sentences / elapsed, 2),
+        "scenes_per_sec": round(scenes / elapsed, 2),
+        "stages_ms": {
+            stage: round(seconds / repeat * 1000, 3)
+            for stage, seconds in sorted(totals.items())
+        },
+        "peak_traced_mb": round(peak / 1024 / 1024, 2),
+    }
+
+
+def run(corpus_dir: str, repeat: int, rounds: int, max_scenes: int, mode: str) -> dict:
+    processor = StoryProcessing(mode=mode)
+    load_start = time.perf_counter()
+    nlp = processor.nlp
+    load_seconds = time.perf_counter() - load_start
+
+    stories = {
+        name: bench_story(text, repeat, rounds, max_scenes, mode)
+        for name, text in load_corpus(corpus_dir).items()
+    }
+    total_seconds = sum(s["seconds_per_run"] for s in stories.values())
+    total_sentences = sum(s["sentences"] for s in stories.values())
+    total_scenes = sum(s["scenes"] for s in stories.values())
+    return {
+        "meta": {
+            "mode": mode,
+            "model": model_version(processor.model),
+            "pipes": nlp.pipe_names,
+            "spacy": spacy.__version__,
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "repeat": repeat,
+            "rounds": rounds,
+            "max_scenes": max_scenes,
+            "model_load_seconds": round(load_seconds, 3),
+            "max_rss_mb": max_rss_mb(),
+        },
+        "stories": stories,
+        "total": {
+            "sentences_per_sec": round(total_sentences / total_seconds, 2),
+            "scenes_per_sec": round(total_scenes / total_seconds, 2),
+        },
+    }
+
+
+def compare(current: dict, baseline: dict, threshold: float) -> list:
+    """Names whose sentences/sec fell more than ``threshold`` below baseline"""
+    pairs = [("total", current["total"], baseline.get("total"))]
+    pairs += [
+        (name, stats, baseline.get("stories", {}).get(name))
+        for name, stats in current["stories"].items()
+    ]
+    regressions = []
+    for name, now, before in pairs:
+        if not before or not before.get("sentences_per_sec"):
+            continue
+        change = now["sentences_per_sec"] / before["sentences_per_sec"] - 1
+        print(
+            f"{name:<28} {before['sentences_per_sec']:>10.1f} -> "
+            f"{now['sentences_per_sec']:>10.1f} sent/s ({change:+.1%})"
+        )
+        if change < -threshold:
+            regressions.append(name)
+    return regressions
+
+
+def print_report(report: dict) -> None:
+    meta = report["meta"]
+    print(f"model {meta['model']} pipes={','.join(meta['pipes'])} repeat={meta['repeat']}")
+    for name, stats in report["stories"].items():
+        stages = ", ".join(f"{k}={v}ms" for k, v in stats["stages_ms"].items())
+        print(
+            f"{name:<28} {stats['chars']:>7} chars {stats['sentences_per_sec']:>10.1f} sent/s "
+            f"{stats['scenes_per_sec']:>9.1f} scenes/s peak {stats['peak_traced_mb']}MB\n"
+            f"{'':<28} {stages}"
+        )
+    print(f"{'total':<28} {report['total']['sentences_per_sec']:>10.1f} sent/s")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--corpus", default=CORPUS_DIR)
+    parser.add_argument("--repeat", type=int, default=20, help="runs per round")
+    parser.add_argument("--rounds", type=int, default=5, help="the fastest round is reported")
+    parser.add_argument(
+        "--max-scenes", type=int, default=5, help="5 matches production segmentation"
+    )
+    parser.add_argument(
+        "--mode",
+        choices=[m.value for m in SegmentMode],
+        default=SegmentMode.FULL.value,
+        help="full: trained pipeline (SPACY_MODEL); fast: tokenizer + sentencizer",
+    )
+    parser.add_argument("--output", help="write the report as JSON (e.g. a new baseline)")
+    parser.add_argument("--compare", help="baseline JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=0.10)
+    args = parser.parse_args()
+
+    report = run(args.corpus, args.repeat, args.rounds, args.max_scenes, args.mode)
+    print_report(report)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        if baseline["meta"]["model"] != report["meta"]["model"]:
+            print(
+                f"{args.compare} was recorded with {baseline['meta']['model']}, "
+                f"this run uses {report['meta']['model']}"
+            )
+            return 2
+        regressions = compare(report, baseline, args.threshold)
+        if regressions:
+            print(f"Throughput regressed more than {args.threshold:.0%}: {', '.join(regressions)}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
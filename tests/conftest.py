@@ -0,0 +1,21 @@
+import os
+import sys
+import tempfile
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path[:0] = [os.path.join(ROOT, "app"), ROOT]
+
+# The engines are built when database.session is first imported, so the test
+# databases are chosen here: a SQLite primary and a replica that cannot open
+_DB_DIR = tempfile.mkdtemp(prefix="animatic-tests-")
+_PRIMARY = os.path.join(_DB_DIR, "primary.db")
+_BROKEN = os.path.join(_DB_DIR, "missing", "replica.db")
+os.environ.update(
+    DATABASE_URL=f"sqlite:///{_PRIMARY}",
+    ASYNC_DATABASE_URL=f"sqlite+aiosqlite:///{_PRIMARY}",
+    REPLICA_DATABASE_URLS=f"sqlite:///{_BROKEN}",
+    ASYNC_REPLICA_DATABASE_URLS=f"sqlite+aiosqlite:///{_BROKEN}",
+    # Try the broken replica on every call instead of skipping it
+    REPLICA_RETRY_SECONDS="0",
+    SEGMENT_CACHE_REDIS="false",
+)
@@ -0,0 +1,45 @@
+import pytest
+from database.session import engine, session
+from app.database.init_db import init_models
+from app.database.models.user import User
+from modules.admin.users.repository import AdminUserRepository, fulltext_terms
+
+
+@pytest.fixture(scope="module", autouse=True)
+def users():
+    init_models()
+    with session() as db:
+        db.add_all(
+            [
+                User(fullName="John Smith", email="jsmith@acme-search.test", password="x"),
+                User(fullName="Ana 100% Real", email="ana@other-search.test", password="x"),
+            ]
+        )
+        db.commit()
+    yield
+    engine.dispose()
+
+
+def search(q):
+    with session() as db:
+        return sorted(u.email for u in AdminUserRepository(db).list_users(q, None, 50))
+
+
+def test_search_matches_inside_the_name():
+    assert search("smith") == ["jsmith@acme-search.test"]
+    assert search("SMITH") == ["jsmith@acme-search.test"]
+
+
+def test_search_matches_the_email_domain():
+    assert search("acme-search") == ["jsmith@acme-search.test"]
+
+
+def test_search_escapes_like_wildcards():
+    assert search("100%") == ["ana@other-search.test"]
+    assert search("%") == ["ana@other-search.test"]
+
+
+def test_fulltext_terms_require_each_word_as_a_prefix():
+    assert fulltext_terms("John smith") == "+John* +smith*"
+    assert fulltext_terms("j@example.com") == "+example* +com*"
+    assert fulltext_terms("jo") is None
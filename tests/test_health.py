@@ -0,0 +1,42 @@
+import asyncio
+import json
+import pytest
+import main
+from core.startup import StartupState
+
+
+@pytest.fixture
+def state(monkeypatch):
+    state = StartupState()
+    monkeypatch.setattr(main, "startup_state", state)
+
+    async def reachable(ping):
+        return True
+
+    monkeypatch.setattr(main, "_check", reachable)
+    return state
+
+
+def ready():
+    response = asyncio.run(main.health_ready())
+    return response.status_code, json.loads(response.body)
+
+
+def test_ready_after_warm_up(state):
+    with state.phase("nlp_model"):
+        pass
+    assert ready()[0] == 503
+    state.finish_warm_up()
+    assert ready()[0] == 200
+
+
+def test_not_ready_when_a_required_phase_failed(state):
+    with state.phase("nlp_model"):
+        raise OSError("Can't find model 'en_core_web_sm'")
+    with state.phase("nlp_pool"):
+        pass
+    state.finish_warm_up()
+    status, body = ready()
+    assert status == 503
+    assert body["checks"]["nlp"] is False
+    assert body["startup"]["phases"]["nlp_model"]["error"] == "Can't find model 'en_core_web_sm'"
@@ -0,0 +1,21 @@
+import os
+import subprocess
+import sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+
+def test_registry_imports_without_resource_module():
+    # `resource` is Unix only; on Windows the import must not take the app down
+    code = (
+        "import sys; sys.modules['resource'] = None\n"
+        "from modules.story.model_registry import get_nlp, max_rss_mb, registry\n"
+        "get_nlp('blank:en')\n"
+        "assert max_rss_mb() is None\n"
+        "assert 'max_rss_mb' not in registry.stats()['blank:en']\n"
+    )
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join([*sys.path, os.path.join(ROOT, "app")])}
+    result = subprocess.run(
+        [sys.executable, "-c", code], cwd=ROOT, env=env, capture_output=True, text=True
+    )
+    assert result.returncode == 0, result.stderr
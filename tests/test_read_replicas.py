@@ -0,0 +1,70 @@
+import asyncio
+import pytest
+from database.session import async_engine, async_replicas, async_session, engine, replicas, session
+from app.database.init_db import init_models
+from app.database.models.user import User
+from app.database.models.project import Project
+from app.database.models.scene import Scene
+from modules.project.repository import AsyncProjectRepository
+from modules.admin.users.repository import AdminUserRepository
+
+
+@pytest.fixture(scope="module")
+def project():
+    init_models()
+    with session() as db:
+        user = User(fullName="Replica Test", email="replica@example.com", password="x")
+        db.add(user)
+        db.flush()
+        project = Project(user_id=user.id, title="Primary only", story_text="A story.")
+        db.add(project)
+        db.flush()
+        db.add(Scene(project_id=project.id, scene_index=0, description="A story."))
+        db.commit()
+        ids = {"user_id": user.id, "project_id": project.id}
+    yield ids
+    engine.dispose()
+
+
+def run(call):
+    async def main():
+        try:
+            async with async_session() as db:
+                return await call(AsyncProjectRepository(db))
+        finally:
+            await async_engine.dispose()
+
+    return asyncio.run(main())
+
+
+def test_list_summaries_falls_back_to_primary(project):
+    failures = async_replicas.failures
+    rows = run(lambda repo: repo.list_summaries(project["user_id"], 10))
+    assert [r.title for r in rows] == ["Primary only"]
+    assert async_replicas.failures == failures + 1
+
+
+def test_get_detail_falls_back_to_primary(project):
+    detail = run(lambda repo: repo.get_detail(project["project_id"], project["user_id"]))
+    assert detail["title"] == "Primary only"
+    assert [s["description"] for s in detail["scenes"]] == ["A story."]
+
+
+def test_view_by_id_falls_back_to_primary(project):
+    found = run(lambda repo: repo.view_by_id(project["project_id"], project["user_id"]))
+    assert found.title == "Primary only"
+
+
+def test_get_by_id_never_reads_a_replica(project):
+    reads = async_replicas.reads
+    found = run(lambda repo: repo.get_by_id(project["project_id"], project["user_id"]))
+    assert found.title == "Primary only"
+    assert async_replicas.reads == reads
+
+
+def test_admin_list_users_falls_back_to_primary(project):
+    failures = replicas.failures
+    with session() as db:
+        users = AdminUserRepository(db).list_users("replica@example.com", None, 10)
+    assert [u.email for u in users] == ["replica@example.com"]
+    assert replicas.failures == failures + 1
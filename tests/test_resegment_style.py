@@ -0,0 +1,85 @@
+import pytest
+from sqlalchemy import select, update
+from database.session import engine, session
+from app.database.init_db import init_models
+from app.database.models.user import User
+from app.database.models.project import Project
+from app.database.models.scene import Scene
+from modules.scene.repository import SceneRepository
+from modules.scene.service import SceneService
+from modules.story import processor as story_processor
+from modules.story.model_registry import FAST_MODEL
+from modules.story.processor import StoryProcessing
+from modules.story.styles import get_style, restyle_prompts
+
+STORY = "Kenji ran through the rain. The old master waited at the temple gate."
+
+
+def test_restyle_prompts_swaps_the_style_wording():
+    shonen, chibi = get_style("shonen"), get_style("chibi")
+    background = shonen.background_prompt("dark cave", ["Aiko"], "exciting")
+    characters = shonen.character_prompts(["Aiko", "Renji"])
+    assert restyle_prompts(background, characters, chibi) == (
+        chibi.background_prompt("dark cave", ["Aiko"], "exciting"),
+        chibi.character_prompts(["Aiko", "Renji"]),
+    )
+    assert restyle_prompts("a hand-written prompt", characters, chibi) is None
+
+
+@pytest.fixture
+def project_id(request, monkeypatch):
+    monkeypatch.setattr(story_processor, "SPACY_MODEL", FAST_MODEL)
+    init_models()
+    with session() as db:
+        user = User(fullName="Style Test", email=f"{request.node.name}@example.com", password="x")
+        db.add(user)
+        db.flush()
+        project = Project(user_id=user.id, title="Styled", story_text=STORY, duration_sec=20)
+        db.add(project)
+        db.commit()
+        scenes = StoryProcessing(anime_style="shonen").process_story(STORY, use_cache=False)
+        SceneRepository(db).create_many(scenes, project.id)
+        project_id = project.id
+    yield project_id
+    engine.dispose()
+
+
+def resegment(project_id, style):
+    with session() as db:
+        user_id = db.get(Project, project_id).user_id
+        return SceneService(db).resegment_story(project_id, user_id, style=style)
+
+
+def scenes(project_id):
+    with session() as db:
+        return db.execute(
+            select(Scene.id, Scene.background_prompt, Scene.character_prompts)
+            .where(Scene.project_id == project_id)
+            .order_by(Scene.scene_index)
+        ).all()
+
+
+def test_style_change_rewrites_kept_prompts(project_id):
+    before = scenes(project_id)
+    result = resegment(project_id, "shojo")
+    assert result.status_code == 200
+    assert (result.data["kept"], result.data["added"]) == (2, 0)
+
+    expected = StoryProcessing(anime_style="shojo").process_story(STORY, use_cache=False)
+    after = scenes(project_id)
+    assert [s.id for s in after] == [s.id for s in before]
+    assert [s.background_prompt for s in after] == [s["background_prompt"] for s in expected]
+    assert [s.character_prompts for s in after] == [s["character_prompts"] for s in expected]
+
+
+def test_unrecognised_prompts_are_regenerated(project_id):
+    with session() as db:
+        db.execute(
+            update(Scene)
+            .where(Scene.project_id == project_id, Scene.scene_index == 0)
+            .values(background_prompt="edited by hand")
+        )
+        db.commit()
+    result = resegment(project_id, "shojo")
+    assert (result.data["kept"], result.data["added"], result.data["removed"]) == (1, 1, 1)
+    assert scenes(project_id)[0].background_prompt.endswith(get_style("shojo").background_tail)
@@ -0,0 +1,23 @@
+from modules.scene.service import SceneService
+from modules.story.cache import segmentation_cache
+from modules.story.processor import StoryProcessing
+
+STORY = "Kenji ran through the rain. The old master waited at the temple gate."
+
+
+def test_preview_is_not_cached():
+    segmentation_cache.clear()
+    response = SceneService(None).preview_segmentation(STORY)
+    assert response.status_code == 200
+    assert response.data
+    assert segmentation_cache.stats()["entries"] == 0
+
+
+def test_process_story_stores_only_with_use_cache():
+    segmentation_cache.clear()
+    processor = StoryProcessing(mode="fast")
+    processor.process_story(STORY, use_cache=False)
+    assert segmentation_cache.get(processor.cache_key(STORY)) is None
+
+    scenes = processor.process_story(STORY)
+    assert segmentation_cache.get(processor.cache_key(STORY)) == scenes
@@ -0,0 +1,93 @@
+import json
+import pytest
+from sqlalchemy import select
+from database.session import engine, session
+from app.database.init_db import init_models
+from app.database.models.user import User
+from app.database.models.project import Project
+from app.database.models.scene import Scene
+from modules.scene.service import SceneService
+from modules.story import processor as story_processor
+from modules.story.cache import segmentation_cache
+from modules.story.model_registry import FAST_MODEL
+
+STORY = "Kenji ran through the rain. The old master waited at the temple gate. They bowed."
+
+
+@pytest.fixture(autouse=True)
+def fast_model(monkeypatch):
+    # The trained pipeline is not needed to test what gets written
+    monkeypatch.setattr(story_processor, "SPACY_MODEL", FAST_MODEL)
+    segmentation_cache.clear()
+
+
+@pytest.fixture
+def project_id(request):
+    init_models()
+    with session() as db:
+        user = User(fullName="Stream Test", email=f"{request.node.name}@example.com", password="x")
+        db.add(user)
+        db.flush()
+        project = Project(user_id=user.id, title="Streamed", story_text=STORY, duration_sec=20)
+        db.add(project)
+        db.flush()
+        db.add(Scene(project_id=project.id, scene_index=0, description="Old scene."))
+        db.commit()
+        project_id = project.id
+    yield project_id
+    engine.dispose()
+
+
+def stream(project_id, stop_after=None):
+    with session() as db:
+        service = SceneService(db)
+        project = service.project_repo.get_by_id(project_id, db.get(Project, project_id).user_id)
+        events = service.stream_segmentation(project)
+        sent = []
+        for event in events:
+            sent.append(event)
+            if stop_after is not None and len(sent) == stop_after:
+                events.close()  # what Starlette does when the client goes away
+                break
+    return [e.split("\n")[0].removeprefix("event: ") for e in sent], sent
+
+
+def descriptions(project_id):
+    with session() as db:
+        return db.scalars(
+            select(Scene.description)
+            .where(Scene.project_id == project_id)
+            .order_by(Scene.scene_index)
+        ).all()
+
+
+def test_scenes_are_written_once_the_story_is_done(project_id):
+    names, sent = stream(project_id)
+    assert names == ["scene", "scene", "scene", "done"]
+    done = json.loads(sent[-1].split("data: ", 1)[1])
+    assert [s["scene_index"] for s in done["timeline"]] == [0, 1, 2]
+    assert descriptions(project_id) == [
+        "Kenji ran through the rain.",
+        "The old master waited at the temple gate.",
+        "They bowed.",
+    ]
+
+
+def test_disconnect_keeps_the_previous_scenes(project_id):
+    names, _ = stream(project_id, stop_after=1)
+    assert names == ["scene"]
+    assert descriptions(project_id) == ["Old scene."]
+
+
+def test_failure_keeps_the_previous_scenes(project_id, monkeypatch):
+    original = story_processor.StoryProcessing.iter_scenes
+
+    def fail_after_first(self, story_text):
+        scenes = original(self, story_text)
+        yield next(scenes)
+        raise RuntimeError("NLP worker died")
+
+    monkeypatch.setattr(story_processor.StoryProcessing, "iter_scenes", fail_after_first)
+    names, _ = stream(project_id)
+    assert names == ["scene", "error"]
+    assert descriptions(project_id) == ["Old scene."]
@@ -0,0 +1,51 @@
+import random
+import pytest
+from modules.story import timeline
+from modules.story.timeline import (
+    MAX_SCENE_SEC,
+    MIN_SCENE_SEC,
+    allocate_durations,
+    build_timeline,
+)
+
+
+def random_cases(count, seed=11):
+    rng = random.Random(seed)
+    for _ in range(count):
+        n = rng.choice([1, 2, 3, 5, 8, rng.randint(1, 600)])
+        weights = [rng.uniform(0.5, 12) for _ in range(n)]
+        target = rng.uniform(0, n * 10)
+        yield weights, target
+
+
+@pytest.mark.parametrize("weights, target", list(random_cases(300)))
+def test_durations_fill_the_target_within_bounds(weights, target):
+    durations = allocate_durations(weights, target)
+    reachable = min(max(target, len(weights) * MIN_SCENE_SEC), len(weights) * MAX_SCENE_SEC)
+    assert round(sum(durations) * 100) == round(reachable * 100)
+    assert all(MIN_SCENE_SEC <= d <= MAX_SCENE_SEC for d in durations)
+    assert all(d == round(d, 2) for d in durations)
+
+
+@pytest.mark.parametrize("weights, target", list(random_cases(300, seed=12)))
+def test_vectorized_path_matches_the_scalar_path(weights, target):
+    n = len(weights)
+    target = min(max(target, n * MIN_SCENE_SEC), n * MAX_SCENE_SEC)
+    shift = timeline._solve_shift(weights, target, MIN_SCENE_SEC, MAX_SCENE_SEC)
+    scalar = [min(max(w + shift, MIN_SCENE_SEC), MAX_SCENE_SEC) for w in weights]
+    vectorized = timeline._allocate_vectorized(weights, target, MIN_SCENE_SEC, MAX_SCENE_SEC)
+    assert vectorized == pytest.approx(scalar, abs=1e-9)
+
+
+def test_longer_sentences_stay_longer():
+    durations = allocate_durations([2, 4, 6, 4], 20)
+    assert durations[0] < durations[1] == durations[3] < durations[2]
+    assert sum(durations) == 20
+
+
+def test_no_scenes():
+    assert allocate_durations([], 25) == []
+
+
+def test_timeline_starts_where_the_previous_scene_ends():
+    assert build_timeline([3.5, 4.25, 8]) == [0, 3.5, 7.75]